@@ -1,38 +1,67 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import repeat
 
 import boto3
+from boto3.s3.transfer import S3Transfer, TransferConfig
 from botocore.config import Config
 
 
+_MULTIPART_THRESHOLD = 16 * 1024 * 1024
+"""Files larger than this many bytes are transferred in multiple concurrent parts."""
+
+_MAX_CONCURRENCY = 16
+"""The maximum number of transfer requests (for files or parts of files) a :class:`S3Client` makes at once."""
+
+
 class S3Client:
     def __init__(self):
         endpoint = os.getenv("AWS_ENDPOINT")
         region = os.getenv("AWS_REGION")
+        transfer_config = TransferConfig(multipart_threshold=_MULTIPART_THRESHOLD, max_concurrency=_MAX_CONCURRENCY)
+        # Every file transfer, from any thread, goes through `self._transfer`, so its requests (including the ones made
+        # while submitting transfers) are all the client makes at once. Make the client's connection pool big enough for
+        # all of them, so connections aren't discarded and reopened.
+        max_connections = transfer_config.max_request_concurrency + transfer_config.max_submission_concurrency
         self.resource = boto3.resource("s3", endpoint_url=endpoint, config=Config(region_name=region))
-        self.client = boto3.client("s3", endpoint_url=endpoint, config=Config(region_name=region))
+        self.client = boto3.client(
+            "s3", endpoint_url=endpoint, config=Config(region_name=region, max_pool_connections=max_connections)
+        )
+        # A single transfer manager, whose thread and connection pools are reused by all file transfers, rather than a
+        # new one being set up by every `upload_file` or `download_file` call.
+        self._transfer = S3Transfer(self.client, transfer_config)
 
-    def upload_dir(self, source_path: str, target_bucket: str, target_path: str):
+    def upload_dir(self, source_path: str, target_bucket: str, target_path: str, *, max_workers: int = 16):
         """
         Recursively uploads all files in the directory at ``source_path`` as objects in the AWS ``target_bucket``, all
-        saved under the "directory" ``target_path``.
+        saved under the "directory" ``target_path``. Up to ``max_workers`` files are uploaded at once, sharing this
+        client's limit of concurrent requests.
         """
         assert os.path.isdir(source_path)
+        local_paths, object_keys = [], []
         for root, _, filenames in os.walk(source_path):
             for filename in filenames:
                 file_path_local = os.path.join(root, filename)
-                object_key = os.path.join(target_path, file_path_local[1 + len(source_path) :])
-                self.client.upload_file(file_path_local, target_bucket, object_key)
+                local_paths.append(file_path_local)
+                object_keys.append(os.path.join(target_path, file_path_local[1 + len(source_path) :]))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the results, so any errors raised by the uploads are raised here too.
+            list(executor.map(self._transfer.upload_file, local_paths, repeat(target_bucket), object_keys))
 
-    def download_dir(self, source_bucket: str, source_path: str, target_path: str):
+    def download_dir(self, source_bucket: str, source_path: str, target_path: str, *, max_workers: int = 16):
         """
         Recursively downloads all files living under the ``source_path`` directory in the AWS ``source_bucket``.
-        Downloads them to the local directory ``target_path``.
+        Downloads them to the local directory ``target_path``. Up to ``max_workers`` files are downloaded at once,
+        sharing this client's limit of concurrent requests.
         """
         objects = self.resource.Bucket(source_bucket).objects.filter(Prefix=source_path)
+        object_keys, local_paths = [], []
         for obj in objects:
-            obj_save_path = os.path.join(target_path, obj.key[1 + len(source_path) :])
-            save_dir = os.path.abspath(os.path.dirname(obj_save_path))
-            if not os.path.isdir(save_dir):
-                os.makedirs(save_dir)
-            os.makedirs(os.path.dirname(obj_save_path), exist_ok=True)
-            self.client.download_file(source_bucket, obj.key, obj_save_path)
+            object_keys.append(obj.key)
+            local_paths.append(os.path.join(target_path, obj.key[1 + len(source_path) :]))
+        # Create each parent directory once, rather than once per object.
+        for dirname in {os.path.dirname(path) for path in local_paths}:
+            os.makedirs(dirname, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(partial(self._transfer.download_file, source_bucket), object_keys, local_paths))
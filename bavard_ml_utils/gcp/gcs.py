@@ -1,5 +1,7 @@
 import os
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from bavard_ml_utils.utils import ImportExtraError
 
@@ -12,6 +14,9 @@ except ImportError:
     raise ImportExtraError("gcp", __name__)
 
 
+_GS_PREFIX = "gs://"
+
+
 class GCSClient(Client):
     """
     Subclassed version of :class:`google.cloud.storage.client.Client` that has additional helper methods, and
@@ -32,7 +37,7 @@ class GCSClient(Client):
     @staticmethod
     def is_gcs_uri(path: str) -> bool:
         """Returns ``True`` if ``path`` is a google cloud storage file path."""
-        return path.startswith("gs://")
+        return path.startswith(_GS_PREFIX)
 
     def delete_blob(self, uri: str):
         """Deletes a blob by its global GCS URI e.g. ``gs://my-bucket/my-object``."""
@@ -44,47 +49,64 @@ class GCSClient(Client):
         blob.upload_from_filename(source_path)
         return blob
 
-    def download_blob_to_filename(self, uri: str, filename: str):
+    def download_blob_to_filename(self, uri: str, filename: str, *, ensure_dir: bool = True):
+        """
+        Downloads the blob at GCS ``uri`` to the local ``filename``. If ``ensure_dir`` is ``True``, the parent directory
+        of ``filename`` is created first, if it doesn't already exist.
+        """
         blob = Blob.from_string(uri, self)
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        if ensure_dir:
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
         blob.download_to_filename(filename)
 
-    def upload_dir(self, source_path: str, target_uri: str):
+    def upload_dir(self, source_path: str, target_uri: str, *, max_workers: int = 16):
         """
         Recursively uploads all files in the directory at ``source_path``
         to the GCS directory at ``target_uri`` (`Source <https://stackoverflow.com/questions/48514933/how-to-copy-a-dire
-        ctory-to-google-cloud-storage-using-google-cloud-python-api>`_).
+        ctory-to-google-cloud-storage-using-google-cloud-python-api>`_). Files are uploaded concurrently, using up to
+        ``max_workers`` threads.
         """
         assert os.path.isdir(source_path)
+        local_paths, remote_paths = [], []
         for root, _, filenames in os.walk(source_path):
             for filename in filenames:
                 file_path_local = os.path.join(root, filename)
-                file_path_remote = os.path.join(target_uri, file_path_local[1 + len(source_path) :])
-                self.upload_filename_to_blob(file_path_local, file_path_remote)
+                local_paths.append(file_path_local)
+                remote_paths.append(os.path.join(target_uri, file_path_local[1 + len(source_path) :]))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the results, so any errors raised by the uploads are raised here too.
+            list(executor.map(self.upload_filename_to_blob, local_paths, remote_paths))
 
-    def download_dir(self, source_uri: str, target_path: str):
+    def download_dir(self, source_uri: str, target_path: str, *, max_workers: int = 16):
         """
         Recursively downloads all files living under ``source_uri`` in GCS, downloading
         them into the ``target_path`` directory (`Source <https://stackoverflow.com/questions/49748910/python-download-e
-        ntire-directory-from-google-cloud-storage>`_).
+        ntire-directory-from-google-cloud-storage>`_). Files are downloaded concurrently, using up to ``max_workers``
+        threads.
         """
         bucket_name, bucket_dir = self.parse_gcs_uri(source_uri)
+        # Both prefixes are the same for every blob, so compute them once.
+        prefix_len = len(source_uri) + 1
+        target_prefix = os.path.join(target_path, "")
         # Get list of files under `uri` directory
-        blobs = self.list_blobs(bucket_name, prefix=bucket_dir)
-        for blob in blobs:
+        blob_uris, local_paths = [], []
+        for blob in self.list_blobs(bucket_name, prefix=bucket_dir):
             blob_uri = self.get_blob_uri(blob)
-            blob_path_local = os.path.join(target_path, blob_uri[1 + len(source_uri) :])
-            self.download_blob_to_filename(blob_uri, blob_path_local)
+            blob_uris.append(blob_uri)
+            local_paths.append(target_prefix + blob_uri[prefix_len:])
+        # Create each parent directory once, rather than once per blob.
+        for dirname in {os.path.dirname(path) for path in local_paths}:
+            os.makedirs(dirname, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(partial(self.download_blob_to_filename, ensure_dir=False), blob_uris, local_paths))
 
     def parse_gcs_uri(self, uri: str) -> t.Tuple[str, str]:
         """Returns the bucket and path components of GCS URI ``uri``. Raises an error if no path component exists."""
         assert self.is_gcs_uri(uri)
-        path_components = uri.replace("gs://", "").split("/")
-        assert len(path_components) > 1
-        bucket_name = path_components[0]
-        path = "/".join(path_components[1:])
+        bucket_name, sep, path = uri[len(_GS_PREFIX) :].partition("/")
+        assert sep
         return bucket_name, path
 
     @staticmethod
     def get_blob_uri(blob: Blob) -> str:
-        return "gs://" + blob.bucket.name + "/" + blob.name
+        return f"{_GS_PREFIX}{blob.bucket.name}/{blob.name}"
@@ -8,26 +8,77 @@ from bavard_ml_utils.utils import ImportExtraError
 try:
     from google.auth.credentials import AnonymousCredentials
     from google.cloud.pubsub_v1 import PublisherClient
+    from google.cloud.pubsub_v1.publisher.futures import Future
+    from google.cloud.pubsub_v1.types import BatchSettings
 except ImportError:
     raise ImportExtraError("gcp", __name__)
 
+try:
+    import orjson
+except ImportError:
+    _has_orjson = False
+else:
+    _has_orjson = True
+
 
 class PubSub:
-    """A GCP pub-sub helper client that works out of the box with the GCP pus-sub emulator."""
+    """
+    A GCP pub-sub helper client that works out of the box with the GCP pus-sub emulator. Published messages are sent in
+    batches, according to ``batch_settings``. By default, a batch is sent once it has 100 messages or 1MB of data, or
+    50ms after its first message was published, whichever comes first. So a message may wait up to 50ms longer to be
+    sent than if it were sent on its own, in exchange for far fewer requests under load. Pass ``batch_settings`` with a
+    lower ``max_latency`` if that matters more, or call :meth:`flush` to wait until everything published so far has
+    been sent.
+    """
 
-    def __init__(self, project_id: str, credentials=None):
+    def __init__(self, project_id: str, credentials=None, *, batch_settings: t.Optional[BatchSettings] = None):
         if os.getenv("PUBSUB_EMULATOR_HOST") is not None:
             # We are in a testing context. Make sure the client's default args
             # work in this emulator scenario.
             if credentials is None:
                 credentials = AnonymousCredentials()
         self._project_id = project_id
-        self.client = PublisherClient(credentials=credentials)
+        if batch_settings is None:
+            batch_settings = BatchSettings(max_bytes=1_000_000, max_latency=0.05, max_messages=100)
+        self.client = PublisherClient(batch_settings=batch_settings, credentials=credentials)
+        # The futures of all messages which haven't been sent yet.
+        self._pending: t.Set[Future] = set()
+        # Topic paths are the same every time for a given topic, so only build each one once.
+        self._topic_paths: t.Dict[str, str] = {}
 
-    def publish(self, topic_id: str, msg: t.Any):
+    def publish(self, topic_id: str, msg: t.Any) -> Future:
+        """
+        Publishes ``msg`` to topic ``topic_id`` without waiting for it to be sent. Returns the message's future, whose
+        ``result`` method blocks until the message is sent and returns its message id.
+        """
         topic_path = self.topic_path(topic_id)
-        data_bytes = json.dumps(msg).encode("utf-8")
-        self.client.publish(topic_path, data_bytes)
+        future = self.client.publish(topic_path, _encode_json(msg))
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        return future
+
+    def flush(self, timeout: t.Optional[float] = None):
+        """Blocks until all messages published so far have been sent. Raises an error if any of them failed."""
+        for future in list(self._pending):
+            future.result(timeout=timeout)
 
     def topic_path(self, topic_id: str) -> str:
-        return self.client.topic_path(self._project_id, topic_id)
+        path = self._topic_paths.get(topic_id)
+        if path is None:
+            path = self._topic_paths[topic_id] = self.client.topic_path(self._project_id, topic_id)
+        return path
+
+
+def _encode_json(msg: t.Any) -> bytes:
+    """
+    Encodes ``msg`` as UTF-8 JSON bytes, using the faster ``orjson`` library when it's installed. Falls back to
+    :func:`json.dumps` for messages ``orjson`` can't encode (e.g. ones containing subclasses of ``float`` other than
+    numpy scalars).
+    """
+    if _has_orjson:
+        try:
+            # Like `json`, accept dictionaries with non-string keys, and numpy scalars.
+            return orjson.dumps(msg, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(msg).encode("utf-8")
@@ -3,12 +3,13 @@ from abc import ABC, abstractmethod
 from collections import Counter, defaultdict
 from itertools import chain
 
+from bavard_ml_utils.ml.utils import to_object_array
 from bavard_ml_utils.utils import requires_extras
 
 
 try:
+    import numpy as np
     from sklearn.model_selection import RepeatedStratifiedKFold, train_test_split
-    from sklearn.utils import resample
 except ImportError:
     _has_ml_deps = False
 else:
@@ -43,10 +44,17 @@ class LabeledDataset(t.List[_T], ABC):
     ... # test == [('no good', -1), ('I love this', 1)]
     """
 
+    _labels_cache: t.Optional[list] = None
+    """
+    The labels of the items in ``self``, computed lazily by :meth:`_labels`. Invalidated whenever the list is mutated
+    through one of the list's methods. Items that are mutated in place are not tracked.
+    """
+
     def __init__(self, items: t.Optional[t.Iterable[_T]] = None):
         if items is None:
             items = []
         super().__init__(items)
+        self._labels_cache = None
 
     @abstractmethod
     def get_label(self, item: _T) -> t.Any:
@@ -57,10 +65,10 @@ class LabeledDataset(t.List[_T], ABC):
         pass
 
     def labels(self) -> list:
-        return [self.get_label(item) for item in self]
+        return list(self._labels())
 
     def unique_labels(self) -> set:
-        return set(self.get_label(item) for item in self)
+        return set(self._labels())
 
     def get_label_distribution(self) -> Counter:
         """
@@ -68,7 +76,7 @@ class LabeledDataset(t.List[_T], ABC):
         The returned :class:`Counter` object can be treated as a dictionary e.g.
         ``my_label_count = counter["my_label"]``.
         """
-        return Counter(self.labels())
+        return Counter(self._labels())
 
     @requires_extras(ml=_has_ml_deps)
     def cv(
@@ -79,9 +87,10 @@ class LabeledDataset(t.List[_T], ABC):
         Repeats the random splitting ``nrepeats`` times.
         """
         cls = self.__class__
+        items = to_object_array(self)
         rskf = RepeatedStratifiedKFold(n_splits=nfolds, n_repeats=nrepeats, random_state=seed)
-        for train_index, test_index in rskf.split(self, self.labels()):
-            yield cls([self[i] for i in train_index]), cls(self[i] for i in test_index)
+        for train_index, test_index in rskf.split(items, self._labels()):
+            yield cls(items[train_index].tolist()), cls(items[test_index].tolist())
 
     @requires_extras(ml=_has_ml_deps)
     def balance(self, seed: int = 0) -> "LabeledDataset":
@@ -90,15 +99,16 @@ class LabeledDataset(t.List[_T], ABC):
         are upsampled to have the same number items as the majority label.
         """
         cls = self.__class__
-        items_by_label = defaultdict(list)
-        for item in self:
-            items_by_label[self.get_label(item)].append(item)
-        n_majority_label = max(len(items) for items in items_by_label.values())
+        indices_by_label = defaultdict(list)
+        for i, label in enumerate(self._labels()):
+            indices_by_label[label].append(i)
+        n_majority_label = max(len(indices) for indices in indices_by_label.values())
+        # One generator for all the labels, so each label's draw is independent but the result is still deterministic.
+        rng = np.random.default_rng(seed)
         upsampled = chain.from_iterable(
-            resample(items, replace=True, n_samples=n_majority_label, random_state=seed)
-            for items in items_by_label.values()
+            rng.choice(indices, size=n_majority_label).tolist() for indices in indices_by_label.values()
         )
-        return cls(upsampled)
+        return cls(self[i] for i in upsampled)
 
     @requires_extras(ml=_has_ml_deps)
     def split(
@@ -106,7 +116,68 @@ class LabeledDataset(t.List[_T], ABC):
     ) -> t.Tuple["LabeledDataset", "LabeledDataset"]:
         """Returns a train/test split of ``self``, stratified by label."""
         cls = self.__class__
-        train, test = train_test_split(
-            self, test_size=test_size, random_state=seed, shuffle=shuffle, stratify=self.labels()
+        items = to_object_array(self)
+        # Split the indices rather than `self`, so the items can be gathered with numpy indexing afterwards.
+        train_index, test_index = train_test_split(
+            np.arange(len(items)), test_size=test_size, random_state=seed, shuffle=shuffle, stratify=self._labels()
         )
-        return cls(train), cls(test)
+        return cls(items[train_index].tolist()), cls(items[test_index].tolist())
+
+    def _labels(self) -> list:
+        """
+        Returns the cached labels of ``self``, computing them first if needed. The returned list is shared, so it
+        should not be mutated.
+        """
+        if self._labels_cache is None:
+            self._labels_cache = [self.get_label(item) for item in self]
+        return self._labels_cache
+
+    # Overrides of all the list methods that mutate the list, so the label cache stays in sync with the items.
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._labels_cache = None
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._labels_cache = None
+
+    def __iadd__(self, other):
+        self._labels_cache = None
+        return super().__iadd__(other)
+
+    def __imul__(self, n):
+        self._labels_cache = None
+        return super().__imul__(n)
+
+    def append(self, item: _T):
+        super().append(item)
+        self._labels_cache = None
+
+    def extend(self, items: t.Iterable[_T]):
+        super().extend(items)
+        self._labels_cache = None
+
+    def insert(self, index, item: _T):
+        super().insert(index, item)
+        self._labels_cache = None
+
+    def pop(self, index=-1) -> _T:
+        self._labels_cache = None
+        return super().pop(index)
+
+    def remove(self, item: _T):
+        super().remove(item)
+        self._labels_cache = None
+
+    def clear(self):
+        super().clear()
+        self._labels_cache = None
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._labels_cache = None
+
+    def reverse(self):
+        super().reverse()
+        self._labels_cache = None
@@ -1,20 +1,39 @@
 import typing as t
+from collections import defaultdict
+from itertools import chain, islice
 
 
 try:
     import numpy as np
     from sklearn.model_selection import StratifiedKFold
-    from sklearn.utils import shuffle as do_shuffle
 except ImportError:
     _has_ml_deps = False
 else:
     _has_ml_deps = True
 
+try:
+    from numba import njit, prange
+except ImportError:
+    _has_numba = False
+else:
+    _has_numba = True
+
 from bavard_ml_utils.utils import requires_extras
 
 
 _T = t.TypeVar("_T")
 
+_ONEHOT_NUMBA_MIN_SIZE = 100_000
+"""Inputs to :func:`onehot` with at least this many items are encoded with numba, when it's installed."""
+
+if _has_numba:
+
+    @njit(parallel=True)
+    def _onehot_scatter(flat, out, depth):
+        # Each item writes to its own row of `out`, so the writes can be split across threads without any locking.
+        for i in prange(flat.size):
+            out[i * depth + flat[i]] = 1
+
 
 def leave_one_out(items: t.List[_T]) -> t.Iterable[t.Tuple[_T, t.List[_T]]]:
     """
@@ -22,8 +41,22 @@ def leave_one_out(items: t.List[_T]) -> t.Iterable[t.Tuple[_T, t.List[_T]]]:
     ``item_i``, as well as all items in ``items`` except ``item_i`` as a list. So given ``items==[1,2,3,4]``, the first
     iteration would yield ``(1, [2,3,4])``, the second will yield ``(2, [1,3,4])``, and so on.
     """
+    # `rest` always holds every item except the current one. Moving from item `i-1` to item `i` only changes one slot of
+    # it, so each iteration costs a single copy, rather than two slices and a concatenation.
+    rest = list(items[1:])
     for i, item in enumerate(items):
-        yield item, items[:i] + items[i + 1 :]
+        if i > 0:
+            rest[i - 1] = items[i - 1]
+        yield item, rest.copy()
+
+
+def leave_one_out_lazy(items: t.Sequence[_T]) -> t.Iterable[t.Tuple[_T, t.Iterator[_T]]]:
+    """
+    Same as :func:`leave_one_out`, but the items other than ``item_i`` are yielded as a one-time iterator over
+    ``items``, instead of a new list. Useful for large ``items`` when the rest only needs to be iterated over once.
+    """
+    for i, item in enumerate(items):
+        yield item, chain(islice(items, 0, i), islice(items, i + 1, None))
 
 
 @requires_extras(ml=_has_ml_deps)
@@ -34,12 +67,26 @@ def make_stratified_folds(
     Takes ``data``, a list, and breaks it into ``nfolds`` chunks. Each chunk is stratified
     by `labels`.
     """
+    items = to_object_array(data)
     skf = StratifiedKFold(n_splits=nfolds, shuffle=shuffle, random_state=seed)
-    fold_indices = [indices for _, indices in skf.split(data, labels)]
-    folds = tuple([data[i] for i in indices] for indices in fold_indices)
+    fold_indices = [indices for _, indices in skf.split(items, labels)]
     if shuffle:
-        folds = tuple(do_shuffle(fold, random_state=seed) for fold in folds)
-    return folds
+        rng = np.random.default_rng(seed)
+        fold_indices = [rng.permutation(indices) for indices in fold_indices]
+    return tuple(items[indices].tolist() for indices in fold_indices)
+
+
+@requires_extras(ml=_has_ml_deps)
+def to_object_array(items: t.Sequence) -> "np.ndarray":
+    """
+    Returns ``items`` in a 1D numpy object array, so subsets of them can be gathered by an index array in a single numpy
+    call. The array is filled item by item, since ``np.asarray`` would turn sequence items (e.g. tuples) into extra
+    dimensions.
+    """
+    arr = np.empty(len(items), dtype=object)
+    for i, item in enumerate(items):
+        arr[i] = item
+    return arr
 
 
 @requires_extras(ml=_has_ml_deps)
@@ -65,30 +112,75 @@ def aggregate_dicts(dicts: t.Sequence[dict], agg: str = "mean") -> dict:
         "max": np.max,
     }
     assert len(dicts) > 0
-    keys = dicts[0].keys()
-    result = {}
-    for key in keys:
-        values = [d[key] for d in dicts]
-        if isinstance(values[0], dict):
-            # Recurse
-            result[key] = aggregate_dicts(values, agg)
-        else:
-            result[key] = aggs[agg](values, axis=0)
+    paths = _leaf_paths(dicts[0])
+    # Leaves that share a shape and dtype are stacked into a single array, so each group is aggregated with one call.
+    paths_by_kind: t.Dict[tuple, t.List[tuple]] = defaultdict(list)
+    for path in paths:
+        value = np.asarray(_get_path(dicts[0], path))
+        paths_by_kind[(value.shape, value.dtype)].append(path)
+
+    result = _skeleton(dicts[0])
+    for group in paths_by_kind.values():
+        stacked = np.asarray([[_get_path(d, path) for path in group] for d in dicts])
+        for path, value in zip(group, aggs[agg](stacked, axis=0)):
+            _set_path(result, path, value)
     return result
 
 
+def _leaf_paths(d: dict, prefix: tuple = ()) -> t.List[tuple]:
+    """Returns the key paths to all the non-dict values nested in ``d``."""
+    paths = []
+    for key, value in d.items():
+        if isinstance(value, dict):
+            paths += _leaf_paths(value, prefix + (key,))
+        else:
+            paths.append(prefix + (key,))
+    return paths
+
+
+def _skeleton(d: dict) -> dict:
+    """Copies the nested dict structure of ``d``, with ``None`` in place of its non-dict values."""
+    return {key: _skeleton(value) if isinstance(value, dict) else None for key, value in d.items()}
+
+
+def _get_path(d: dict, path: tuple):
+    for key in path:
+        d = d[key]
+    return d
+
+
+def _set_path(d: dict, path: tuple, value):
+    for key in path[:-1]:
+        d = d[key]
+    d[path[-1]] = value
+
+
 @requires_extras(ml=_has_ml_deps)
 def onehot(data, axis=-1, dtype=None):
-    """A pure numpy implementation of the one-hot encoding function for arrays of arbitrary dimensionality.
-    (`Source <https://stackoverflow.com/a/63840293>`_).
+    """
+    A numpy implementation of the one-hot encoding function for arrays of arbitrary dimensionality. If `numba
+    <https://numba.pydata.org/>`_ is installed, large inputs are encoded in parallel across all CPU cores.
     """
     if dtype is None:
         dtype = np.float32
     pos = axis if axis >= 0 else data.ndim + axis + 1
-    shape = list(data.shape)
-    shape.insert(pos, data.max() + 1)
-    out = np.zeros(shape, dtype)
-    ind = list(np.indices(data.shape, sparse=True))
-    ind.insert(pos, data)
-    out[tuple(ind)] = True
-    return out
+    depth = int(data.max()) + 1
+    flat = data.reshape(-1)
+    # Neither scatter below checks its indices, so validate them here. Negative labels count back from the last class,
+    # like any other numpy index.
+    if not np.issubdtype(flat.dtype, np.integer):
+        raise IndexError(f"onehot requires integer labels, got {flat.dtype}")
+    min_label = int(flat.min())
+    if min_label < -depth:
+        raise IndexError(f"label {min_label} is out of bounds for {depth} classes")
+    if min_label < 0:
+        flat = np.where(flat < 0, flat + depth, flat)
+    # Scatter into a flat buffer with the one-hot axis last, so each item's hot index is just an offset into its own
+    # contiguous row. Then move the one-hot axis to where it was requested.
+    out = np.zeros(flat.size * depth, dtype)
+    if _has_numba and flat.size >= _ONEHOT_NUMBA_MIN_SIZE:
+        _onehot_scatter(flat, out, depth)
+    else:
+        out[np.arange(flat.size) * depth + flat] = 1
+    out = out.reshape(data.shape + (depth,))
+    return np.moveaxis(out, -1, pos)
@@ -1,6 +1,7 @@
 import time
 import typing as t
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 from fastapi import HTTPException, status
 from loguru import logger
@@ -34,9 +35,24 @@ class BaseDatasetRecord(Record):
     """An automatically generated hash of this record."""
 
     def __init__(self, **data):
-        """Custom constructor. Includes a post-init step to update the record's digest."""
+        """
+        Custom constructor. Includes a post-init step to update the record's digest, which is skipped when the record
+        is being deserialized via :meth:`parse_obj` and already has one.
+        """
+        trust_digest = data.pop("_trust_digest", False)
         super().__init__(**data)
-        self.digest = self.compute_digest()
+        if not trust_digest or self.digest is None:
+            self.digest = self.compute_digest()
+
+    @classmethod
+    def parse_obj(cls, obj):
+        """
+        Deserializes a record, e.g. one loaded from a record store. The record's existing digest is kept as is, since
+        recomputing it means serializing and hashing the whole dataset.
+        """
+        if isinstance(obj, dict) and obj.get("digest") is not None:
+            obj = {**obj, "_trust_digest": True}
+        return super().parse_obj(obj)
 
     def compute_digest(self):
         """
@@ -155,13 +171,15 @@ class BaseArtifactManager(ABC):
             self.save_artifact(artifact, dataset)
             return artifact
 
-    def sync(self) -> int:
+    def sync(self, *, max_workers: int = 1) -> int:
         """
         Ensures this service version has its own artifact for all currently saved datasets. Returns the number of
-        artifacts that had to be created for that to happen.
+        artifacts that had to be created for that to happen. Artifacts are created, and old service versions' data is
+        removed, concurrently using up to ``max_workers`` threads, so only set it above 1 if
+        :meth:`create_artifact_from_dataset` and the record stores are thread safe.
         """
-        digest2agent = {dataset.digest: dataset.agent_id for dataset in self._datasets.get_all()}
-        all_dataset_digests = set(digest2agent.keys())
+        digest2dataset = {dataset.digest: dataset for dataset in self._datasets.get_all()}
+        all_dataset_digests = set(digest2dataset.keys())
         datasets_currently_indexed = {
             artifact.dataset_digest for artifact in self._artifacts.get_all(service_version=self.version)
         }
@@ -170,27 +188,25 @@ class BaseArtifactManager(ABC):
             f"creating artifact for {len(datasets_to_index)}/{len(all_dataset_digests)} "
             f"existing datasets for service version {self.version}"
         )
-        for digest in datasets_to_index:
-            dataset = self._datasets.get(digest2agent[digest])
-            if dataset is None:
-                raise AssertionError(
-                    f"Expected dataset to exist for agent {digest2agent[digest]}. It existed just a little bit ago."
-                )
-            logger.info(
-                f"creating artifact for dataset digest={dataset.digest} associated with agent {digest2agent[digest]}"
-            )
-            artifact = self.create_artifact_from_dataset(dataset)
-            self.save_artifact(artifact, dataset)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the results, so any errors raised while creating the artifacts are raised here too.
+            list(executor.map(self._create_and_save_artifact, (digest2dataset[d] for d in datasets_to_index)))
 
         self._versions.save(ServiceVersionMetadata(name=self.version, synced_at=time.time()))
         logger.info("service version sync utility finished successfully.")
-        self._remove_old_service_versions()
+        self._remove_old_service_versions(max_workers)
         return len(datasets_to_index)
 
-    def _remove_old_service_versions(self):
+    def _create_and_save_artifact(self, dataset: BaseDatasetRecord):
+        logger.info(f"creating artifact for dataset digest={dataset.digest} associated with agent {dataset.agent_id}")
+        artifact = self.create_artifact_from_dataset(dataset)
+        self.save_artifact(artifact, dataset)
+
+    def _remove_old_service_versions(self, max_workers: int = 1):
         """
         Removes all artifacts for any old service versions. We only keep data for the `self._max_service_versions` most
-        recent service versions. The old versions are the ones that have been synced least recently.
+        recent service versions. The old versions are the ones that have been synced least recently. The versions are
+        removed concurrently using up to ``max_workers`` threads.
         """
         versions = list(self._versions.get_all())
         n_to_remove = len(versions) - self._max_service_versions
@@ -198,6 +214,16 @@ class BaseArtifactManager(ABC):
             logger.info(f"removing data for {n_to_remove} old service versions")
             # Remove the oldest versions.
             versions_to_remove = sorted(versions, key=lambda v: v.synced_at)[:n_to_remove]
-            for version in versions_to_remove:
-                self._artifacts.delete_all(service_version=version.name)
-                self._versions.delete(version.get_id())
+            if max_workers == 1:
+                for version in versions_to_remove:
+                    self._remove_service_version(version)
+            else:
+                # The deletes are network-bound, so issue them concurrently. Consume the results, so any errors raised
+                # by the deletes are raised here too.
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    list(executor.map(self._remove_service_version, versions_to_remove))
+
+    def _remove_service_version(self, version: ServiceVersionMetadata):
+        """Removes all artifacts for service version ``version``, along with ``version`` itself."""
+        self._artifacts.delete_all(service_version=version.name)
+        self._versions.delete(version.get_id())
@@ -1,11 +1,14 @@
 import os
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 
 from bavard_ml_utils.utils import ImportExtraError
 
 
 try:
+    from google.api_core.exceptions import FailedPrecondition, NotFound
     from google.auth.credentials import AnonymousCredentials, Credentials
     from google.cloud import firestore
     from google.cloud.firestore_v1 import DocumentSnapshot
@@ -15,6 +18,30 @@ except ImportError:
 from bavard_ml_utils.persistence.record_store.base import BaseRecordStore, RecordT
 
 
+_MAX_BATCH_SIZE = 500
+"""The maximum number of operations Firestore allows in a single batched write."""
+_MAX_CONCURRENT_BATCHES = 8
+"""The maximum number of batched writes to have in flight at once."""
+_PAGE_SIZE = 1000
+"""The number of documents :meth:`FirestoreRecordStore.get_all` fetches per query."""
+
+
+@lru_cache(maxsize=8)
+def _get_client(project: t.Optional[str], credentials: t.Optional[Credentials]) -> firestore.Client:
+    """
+    Creating a client is expensive (credential discovery, channel setup), so record stores using the same project and
+    credentials share one.
+    """
+    if os.getenv("FIRESTORE_EMULATOR_HOST") is not None:
+        # We are in a testing context. Make sure the client's default args
+        # work in this emulator scenario.
+        if credentials is None:
+            credentials = AnonymousCredentials()
+        if project is None:
+            project = "test"
+    return firestore.Client(project=project, credentials=credentials)
+
+
 class FirestoreRecordStore(BaseRecordStore[RecordT]):
     """
     A Firestore DAO for Pydantic data models. In addition to its parent class's `WHERE equals` behavior, this class
@@ -33,14 +60,9 @@ class FirestoreRecordStore(BaseRecordStore[RecordT]):
         credentials: t.Optional[Credentials] = None,
     ):
         super().__init__(record_class, read_only)
-        if os.getenv("FIRESTORE_EMULATOR_HOST") is not None:
-            # We are in a testing context. Make sure the client's default args
-            # work in this emulator scenario.
-            if credentials is None:
-                credentials = AnonymousCredentials()
-            if project is None:
-                project = "test"
-        self.collection = firestore.Client(project=project, credentials=credentials).collection(collection_name)
+        self._client = _get_client(project, credentials)
+        self._field_paths = list(record_class.__fields__)
+        self.collection = self._client.collection(collection_name)
 
     def save(self, record: RecordT):
         self.assert_can_edit()
@@ -49,25 +71,38 @@ class FirestoreRecordStore(BaseRecordStore[RecordT]):
         self.collection.document(record.get_id()).set(record.dict(custom_encoder={datetime: lambda date: date}))
 
     def get(self, id_: str) -> t.Optional[RecordT]:
-        doc = self.collection.document(id_).get()
-        if not doc.exists:
+        # Only fetch the fields the record class has, and rely on `to_dict` returning `None` for a missing document.
+        data = self.collection.document(id_).get(field_paths=self._field_paths).to_dict()
+        if data is None:
             return None
-        return self.record_cls.parse_obj(doc.to_dict())
+        return self.record_cls.parse_obj(data)
 
     def delete(self, id_: str) -> bool:
         self.assert_can_edit()
-        doc = self.collection.document(id_).get()
-        if not doc.exists:
+        # Delete with an existence precondition, so we find out whether the document existed in the same request,
+        # rather than having to read it first.
+        try:
+            self.collection.document(id_).delete(option=self._client.write_option(exists=True))
+        except (NotFound, FailedPrecondition):
             return False
-        doc.reference.delete()
         return True
 
     def get_all(self, *conditions: t.Tuple[str, str, t.Any], **where_equals) -> t.Iterable[RecordT]:
         """
         Retreives all records which satisfy the optional ``*conditions`` and ``**where_equals`` equality conditions.
         """
-        for doc in self._stream(*conditions, **where_equals):
-            yield self.record_cls.parse_obj(doc.to_dict())
+        query = self._query(*conditions, **where_equals).limit(_PAGE_SIZE)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_page = executor.submit(self._fetch_page, query, None)
+            while True:
+                docs = next_page.result()
+                if len(docs) == _PAGE_SIZE:
+                    # Fetch the next page in the background while this one is being deserialized.
+                    next_page = executor.submit(self._fetch_page, query, docs[-1])
+                for doc in docs:
+                    yield self.record_cls.parse_obj(doc.to_dict())
+                if len(docs) < _PAGE_SIZE:
+                    break
 
     def delete_all(self, *conditions: t.Tuple[str, str, t.Any], **where_equals) -> int:
         """
@@ -75,17 +110,44 @@ class FirestoreRecordStore(BaseRecordStore[RecordT]):
         number of records that were deleted.
         """
         self.assert_can_edit()
+        # Delete the documents in batched writes, rather than with one request per document. Full batches are
+        # committed concurrently while the query results are still being streamed.
         num_deleted = 0
-        for doc in self._stream(*conditions, **where_equals):
-            if doc.exists:
-                doc.reference.delete()
+        batch = self._client.batch()
+        with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_BATCHES) as executor:
+            commits = []
+            # Query results only include existing documents, so there's no need to check `doc.exists`.
+            for doc in self._stream_refs_only(*conditions, **where_equals):
+                batch.delete(doc.reference)
                 num_deleted += 1
+                if num_deleted % _MAX_BATCH_SIZE == 0:
+                    commits.append(executor.submit(batch.commit))
+                    batch = self._client.batch()
+            if num_deleted % _MAX_BATCH_SIZE != 0:
+                commits.append(executor.submit(batch.commit))
+            for commit in commits:
+                # Raise any errors from the commits.
+                commit.result()
         return num_deleted
 
-    def _stream(self, *conditions: t.Tuple[str, str, t.Any], **where_equals) -> t.Iterable[DocumentSnapshot]:
+    @staticmethod
+    def _fetch_page(query, last_doc: t.Optional[DocumentSnapshot]) -> t.List[DocumentSnapshot]:
+        """Returns the page of ``query``'s results that comes after ``last_doc``, or its first page if it's ``None``."""
+        if last_doc is not None:
+            query = query.start_after(last_doc)
+        return list(query.stream())
+
+    def _stream_refs_only(self, *conditions: t.Tuple[str, str, t.Any], **where_equals) -> t.Iterable[DocumentSnapshot]:
+        """
+        Streams the documents matching the given conditions. The yielded snapshots only include each document's name
+        and reference, and not its data, so the document bodies aren't read and sent over the wire.
+        """
+        return self._query(*conditions, **where_equals).select(["__name__"]).stream()
+
+    def _query(self, *conditions: t.Tuple[str, str, t.Any], **where_equals):
         query = self.collection
         for field_name, operator, value in conditions:
             query = query.where(field_name, operator, value)
         for field_name, value in where_equals.items():
             query = query.where(field_name, "==", value)
-        return query.stream()
+        return query
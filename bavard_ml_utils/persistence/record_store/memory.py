@@ -1,45 +1,125 @@
 import typing as t
+from collections import defaultdict
+from operator import attrgetter
+from threading import Lock
 
 from bavard_ml_utils.persistence.record_store.base import BaseRecordStore, RecordT
 
 
+_MAX_INDEX_SELECTIVITY = 0.05
+"""
+Queries are only resolved via a secondary index when the index matches at most this fraction of the records in the
+store. Less selective queries use a full scan instead.
+"""
+
+
 class InMemoryRecordStore(BaseRecordStore[RecordT]):
     r"""
-    A simple in-memory DAO for Pydantic data models. Useful for testing or other lightweight needs. Does not keep any
-    indexes of non-primary key fields, so `WHERE` clause queries are :math:`\mathcal{O}(n)`.
+    A simple in-memory DAO for Pydantic data models. Useful for testing or other lightweight needs. `WHERE` clause
+    queries on fields listed in ``indexed_fields`` are resolved using secondary indexes. Other fields are not indexed,
+    so `WHERE` clause queries on only those fields are :math:`\mathcal{O}(n)`. Indexed fields must have hashable
+    values.
     """
 
-    def __init__(self, record_class: t.Type[RecordT], read_only=False):
+    def __init__(self, record_class: t.Type[RecordT], read_only=False, *, indexed_fields: t.Iterable[str] = ()):
         super().__init__(record_class, read_only)
         # Records in the db can be resolved via `self._db[id]`.
         self._db: t.Dict[str, RecordT] = {}
+        # Ids of records having a given value for an indexed field can be resolved via `self._indexes[field][value]`.
+        self._indexes: t.Dict[str, t.Dict[t.Any, t.Set[str]]] = {field: defaultdict(set) for field in indexed_fields}
+        # The values each record had for the indexed fields when it was saved, so it can be removed from the indexes
+        # even if the record object has since been mutated (`get` returns the stored object itself).
+        self._indexed_values: t.Dict[str, t.Tuple[t.Any, ...]] = {}
+        # Guards writes, so the indexes stay in sync with `self._db` when the store is modified from multiple threads.
+        self._lock = Lock()
 
     def save(self, record: RecordT):
         self.assert_can_edit()
-        self._db[record.get_id()] = record
+        id_ = record.get_id()
+        with self._lock:
+            self._unindex(id_)
+            self._db[id_] = record
+            if self._indexes:
+                values = tuple(getattr(record, field) for field in self._indexes)
+                self._indexed_values[id_] = values
+                for index, value in zip(self._indexes.values(), values):
+                    index[value].add(id_)
 
     def get(self, id_: str) -> t.Optional[RecordT]:
         return self._db.get(id_)
 
     def delete(self, id_: str) -> bool:
         self.assert_can_edit()
-        if self.get(id_) is not None:
-            del self._db[id_]
-            return True
-        return False
+        with self._lock:
+            if self.get(id_) is not None:
+                self._unindex(id_)
+                del self._db[id_]
+                return True
+            return False
 
     def get_all(self, **where_equals) -> t.Iterable[RecordT]:
-        for record in self._db.values():
-            if self._matches(record, **where_equals):
+        for id_ in self._find(**where_equals):
+            record = self._db.get(id_)
+            if record is not None:
                 yield record
 
     def delete_all(self, **where_equals) -> int:
         self.assert_can_edit()
-        to_delete = [id_ for id_, record in self._db.items() if self._matches(record, **where_equals)]
-        for id_ in to_delete:
-            del self._db[id_]
+        with self._lock:
+            to_delete = self._find(**where_equals)
+            for id_ in to_delete:
+                self._unindex(id_)
+                del self._db[id_]
         return len(to_delete)
 
+    def _find(self, **where_equals) -> t.List[str]:
+        """Returns the ids of all records which satisfy the ``where_equals`` equality conditions."""
+        indexed = {field: value for field, value in where_equals.items() if field in self._indexes}
+        id_sets = sorted((self._indexes[field].get(value, set()) for field, value in indexed.items()), key=len)
+        if not id_sets or len(id_sets[0]) > _MAX_INDEX_SELECTIVITY * len(self._db):
+            # Either no index applies, or even the most selective one matches so many records that checking them all
+            # would cost about as much as just scanning. Copy the items first, so other threads can safely modify the
+            # store while they're being filtered.
+            if not where_equals:
+                return list(self._db)
+            matches = self._make_predicate(**where_equals)
+            return [id_ for id_, record in list(self._db.items()) if matches(record)]
+        # Only the records matching all the indexed conditions need to be checked. Start from the smallest id set, so
+        # the intersection is as cheap as possible. The candidates are still checked against all the conditions, since
+        # stored records may have been mutated in place since they were indexed.
+        candidates = set(id_sets[0]).intersection(*id_sets[1:])
+        matches = self._make_predicate(**where_equals)
+        ids = []
+        for id_ in candidates:
+            record = self._db.get(id_)
+            if record is not None and matches(record):
+                ids.append(id_)
+        return ids
+
+    def _unindex(self, id_: str):
+        """Removes the record stored under ``id_``, if there is one, from the secondary indexes."""
+        values = self._indexed_values.pop(id_, None)
+        if values is None:
+            return
+        for index, value in zip(self._indexes.values(), values):
+            ids = index[value]
+            ids.discard(id_)
+            if not ids:
+                del index[value]
+
     @staticmethod
-    def _matches(record: RecordT, **where_equals) -> bool:
-        return all(getattr(record, k) == v for k, v in where_equals.items())
+    def _make_predicate(**where_equals) -> t.Callable[[RecordT], bool]:
+        """
+        Returns a function which checks whether a record satisfies the ``where_equals`` equality conditions. The
+        conditions' fields are read from records with a single :func:`operator.attrgetter` call, which is much faster
+        than reading them one at a time.
+        """
+        if not where_equals:
+            return lambda record: True
+        getter = attrgetter(*where_equals.keys())
+        if len(where_equals) == 1:
+            # With a single field, `attrgetter` returns the field's value rather than a tuple.
+            (value,) = where_equals.values()
+            return lambda record: getter(record) == value
+        values = tuple(where_equals.values())
+        return lambda record: getter(record) == values
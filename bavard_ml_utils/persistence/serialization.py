@@ -1,8 +1,13 @@
 import os
 import pickle
 import shutil
+import threading
 import typing as t
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from tempfile import gettempdir, mkdtemp
 
 
 class TypeSerializer(ABC):
@@ -45,7 +50,11 @@ class TypeSerializer(ABC):
 
     @abstractmethod
     def is_serializable(self, obj: object) -> bool:
-        """Should return ``True`` if this serializer should be used to serialze ``obj``."""
+        """
+        Should return ``True`` if this serializer should be used to serialze ``obj``. The answer should only depend on
+        the type of ``obj``, since it is cached per type while serializing. Instances of builtin types like ``int``,
+        ``str``, ``list`` and ``dict`` are always pickled normally, and are never passed to this method.
+        """
         pass
 
     def resolve_path(self, path: str) -> str:
@@ -53,27 +62,59 @@ class TypeSerializer(ABC):
         return f"{path}.{self.ext}" if self.ext else path
 
 
+_BUILTIN_TYPES = frozenset({int, float, complex, str, bytes, bool, tuple, list, dict, set, frozenset, type(None)})
+"""Types that are always pickled the normal way, without checking for a custom serializer."""
+
+
 class _CustomPickler(pickle.Pickler):
-    def __init__(self, pkl_file, assets_path: str, type_serializers: t.Sequence[TypeSerializer]):
-        super().__init__(pkl_file)
-        self._assets_path = assets_path
-        self._ser_map = {ser.type_name: ser for ser in type_serializers}
+    def __init__(
+        self,
+        pkl_file,
+        assets_path: str,
+        type_serializers: t.Sequence[TypeSerializer],
+        executor: t.Optional[ThreadPoolExecutor],
+    ):
+        # Objects supporting out-of-band pickling (e.g. numpy arrays) hand over their data as buffers, which are
+        # collected here and written separately, rather than being copied into the pickle stream.
+        self.buffers: t.List[pickle.PickleBuffer] = []
+        super().__init__(pkl_file, protocol=pickle.HIGHEST_PROTOCOL, buffer_callback=self.buffers.append)
+        # Objects handled by custom serializers are serialized on `executor` if there is one, so their (often slow)
+        # serialization overlaps with pickling the rest of the object graph. Their futures are collected here.
+        self.futures: t.List[Future] = []
+        self._executor = executor
+        # Joined with a trailing separator once, so asset paths can be built by plain concatenation.
+        self._assets_prefix = os.path.join(assets_path, "")
+        self._serializers = type_serializers
+        # Maps each type seen so far to the serializer for its instances, or `None` if it has none, so each type is
+        # only dispatched on once.
+        self._type_cache: t.Dict[type, t.Optional[TypeSerializer]] = {}
         self._unique_id = 0
 
     def persistent_id(self, obj: object) -> t.Optional[tuple]:
-        for ser in self._ser_map.values():
-            if ser.is_serializable(obj):
-                # Treat `obj` as an external object and serialize it using our own
-                # methods. Our serializer's type name and the relative path it was serialized
-                # to is returned and pickled, so the pickler will know how to find
-                # the object again and deserialize it.
-                obj_id = f"{ser.type_name}-{self._get_unique_id()}"
-                obj_path = ser.resolve_path(obj_id)
-                ser.serialize(obj, os.path.join(self._assets_path, obj_path))
-                return ser.type_name, obj_path
-
-        # No custom serializer for `obj`; pickle it using the normal way.
-        return None
+        type_ = type(obj)
+        if type_ in _BUILTIN_TYPES:
+            # The bulk of most object graphs are builtin values, so skip the serializer lookup for those entirely.
+            return None
+        try:
+            ser = self._type_cache[type_]
+        except KeyError:
+            ser = next((ser for ser in self._serializers if ser.is_serializable(obj)), None)
+            self._type_cache[type_] = ser
+        if ser is None:
+            # No custom serializer for `obj`; pickle it using the normal way.
+            return None
+
+        # Treat `obj` as an external object and serialize it using our own
+        # methods. Our serializer's type name and the relative path it was serialized
+        # to is returned and pickled, so the pickler will know how to find
+        # the object again and deserialize it.
+        obj_id = f"{ser.type_name}-{self._get_unique_id()}"
+        obj_path = ser.resolve_path(obj_id)
+        if self._executor is None:
+            ser.serialize(obj, self._assets_prefix + obj_path)
+        else:
+            self.futures.append(self._executor.submit(ser.serialize, obj, self._assets_prefix + obj_path))
+        return ser.type_name, obj_path
 
     def _get_unique_id(self) -> int:
         """A primary key generator."""
@@ -83,10 +124,16 @@ class _CustomPickler(pickle.Pickler):
 
 
 class _CustomUnpickler(pickle.Unpickler):
-    def __init__(self, pkl_file, assets_path: str, type_serializers: t.Sequence[TypeSerializer]):
-        super().__init__(pkl_file)
+    def __init__(
+        self,
+        pkl_file,
+        assets_path: str,
+        ser_map: t.Mapping[str, TypeSerializer],
+        buffers: t.Optional[t.Iterable[memoryview]] = None,
+    ):
+        super().__init__(pkl_file, buffers=buffers)
         self._assets_path = assets_path
-        self._ser_map = {ser.type_name: ser for ser in type_serializers}
+        self._ser_map = ser_map
 
     def persistent_load(self, pid: tuple) -> object:
         """
@@ -103,19 +150,47 @@ class _CustomUnpickler(pickle.Unpickler):
         return ser.deserialize(os.path.join(self._assets_path, obj_path))
 
 
+def _delete_in_background(path: str):
+    """
+    Deletes the directory at ``path``. If the system's temporary directory is on the same filesystem, ``path`` is first
+    moved into it, which is a single cheap rename, so ``path`` is gone once this function returns. The (potentially
+    slow) recursive delete of its contents then happens in a background thread. The thread is not a daemon, so the
+    delete still completes if the interpreter exits first, and if the process is killed before then, what's left is only
+    in the temporary directory. Otherwise, ``path`` is deleted before this function returns.
+    """
+    if os.stat(gettempdir()).st_dev == os.stat(path).st_dev:
+        # A fresh directory guarantees a unique destination, so the rename can't collide with another delete.
+        trash_dir = mkdtemp(prefix="bavard-ml-utils-deleting-")
+        try:
+            os.rename(path, os.path.join(trash_dir, "contents"))
+        except OSError:
+            # The rename can still fail across mount points of the same filesystem (e.g. bind mounts).
+            os.rmdir(trash_dir)
+        else:
+            threading.Thread(target=shutil.rmtree, args=(trash_dir,), kwargs={"ignore_errors": True}).start()
+            return
+    shutil.rmtree(path)
+
+
 class Serializer:
     """
     A replacement for the :func:`pickle.dump` and :func:`pickle.load` functions. Exposes a hook for
     custom serialization behavior of different data types (e.g. keras models, PyTorch models,
     numpy arrays, etc.). Includes support for serializing keras models using their
     native protocols. You can use your own type serializers and pass those in too. Just
-    implement the :class:`TypeSerializer` class and pass an instance of your class to the constructor.
+    implement the :class:`TypeSerializer` class and pass an instance of your class to the constructor. Objects handled
+    by the type serializers are serialized as they are encountered while pickling. If ``max_workers`` is above 1, they
+    are instead serialized in the background while the rest of the object is pickled, using up to ``max_workers``
+    threads, so only set it above 1 if the type serializers are thread safe.
     """
 
-    def __init__(self, *custom_type_serializers: TypeSerializer):
+    def __init__(self, *custom_type_serializers: TypeSerializer, max_workers: int = 1):
         self._type_serializers = custom_type_serializers
+        self._max_workers = max_workers
+        # Built once here rather than by every unpickler, since the registered serializers never change.
+        self._ser_map = {ser.type_name: ser for ser in self._type_serializers}
 
-        if len(self._type_serializers) != len({ser.type_name for ser in self._type_serializers}):
+        if len(self._type_serializers) != len(self._ser_map):
             raise ValueError(
                 "The type_name of each type serializer must be unique."
                 f" Currently registered names: {[ser.type_name for ser in self._type_serializers]}"
@@ -123,15 +198,37 @@ class Serializer:
 
     def serialize(self, obj: object, path: str, overwrite: bool = False):
         """Serialize ``obj`` to ``path``, a directory."""
-        if os.path.isfile(path):
-            raise ValueError(f"cannot serialize to directory {path}; it is a file")
-        if not os.path.isdir(path):
+        # Try creating the directory first, so the common case of a new directory only costs a single syscall.
+        try:
             os.makedirs(path)
-        elif len(os.listdir(path)) > 0 and not overwrite:
-            raise ValueError(f"cannot serialize: {path} is already populated and overwrite is set to False")
+        except FileExistsError:
+            if not os.path.isdir(path):
+                raise ValueError(f"cannot serialize to directory {path}; it is a file")
+            if not overwrite and len(os.listdir(path)) > 0:
+                raise ValueError(f"cannot serialize: {path} is already populated and overwrite is set to False")
 
-        with open(self._get_pkl_path(path), "wb") as f:
-            _CustomPickler(f, path, self._type_serializers).dump(obj)
+        # With a single worker, a pool would add a thread without any parallelism, so serialize inline instead.
+        with ThreadPoolExecutor(max_workers=self._max_workers) if self._max_workers > 1 else nullcontext() as executor:
+            with open(self.get_pkl_path(path), "wb") as f:
+                pickler = _CustomPickler(f, path, self._type_serializers, executor)
+                pickler.dump(obj)
+            buffers_path = self._get_buffers_path(path)
+            if pickler.buffers:
+                with open(buffers_path, "wb") as f:
+                    for buffer in pickler.buffers:
+                        raw = buffer.raw()
+                        f.write(raw.nbytes.to_bytes(8, "little"))
+                        f.write(raw)
+            else:
+                # Don't leave a stale buffers file behind when overwriting. Without one, the directory can also still be
+                # loaded by versions of this class that predate out-of-band buffers.
+                try:
+                    os.remove(buffers_path)
+                except FileNotFoundError:
+                    pass
+            for future in pickler.futures:
+                # Raise any errors from the type serializers.
+                future.result()
 
     def deserialize(self, path: str, delete: bool = False) -> object:
         """
@@ -141,18 +238,59 @@ class Serializer:
         deleted once the deserialization is finished.
         """
         # Deserialize the data
-        with open(self._get_pkl_path(path), "rb") as f:
-            obj = _CustomUnpickler(f, path, self._type_serializers).load()
+        with open(self.get_pkl_path(path), "rb") as f:
+            obj = _CustomUnpickler(f, path, self._ser_map, self._read_buffers(path)).load()
 
         if delete:
-            shutil.rmtree(path)
+            _delete_in_background(path)
 
         return obj
 
     @staticmethod
-    def _get_pkl_path(path: str) -> str:
+    def get_pkl_path(path: str) -> str:
+        """The path of the pickle file :meth:`serialize` writes to directory ``path``."""
         return os.path.join(path, "data.pkl")
 
+    @staticmethod
+    def _get_buffers_path(path: str) -> str:
+        return os.path.join(path, "data.buffers")
+
+    @classmethod
+    def _read_buffers(cls, path: str) -> t.Optional[t.List[memoryview]]:
+        """
+        Reads the out-of-band pickle buffers written by :meth:`serialize` to directory ``path``. The whole file is read
+        into memory at once, and each buffer is a view into it, so the buffers' data is not copied again. Returns
+        ``None`` if ``path`` has no buffers file (i.e. it was serialized by an older version of this class).
+        """
+        buffers_path = cls._get_buffers_path(path)
+        if not os.path.isfile(buffers_path):
+            return None
+        data = bytearray(os.path.getsize(buffers_path))
+        with open(buffers_path, "rb") as f:
+            f.readinto(data)
+        view = memoryview(data)
+        buffers = []
+        offset = 0
+        while offset < len(view):
+            size = int.from_bytes(view[offset : offset + 8], "little")
+            offset += 8
+            buffers.append(view[offset : offset + size])
+            offset += size
+        return buffers
+
+
+_FROM_DIR_CACHE_SIZE = 8
+"""The maximum number of objects :meth:`Persistent.from_dir` keeps cached."""
+
+_from_dir_cache: "OrderedDict[t.Tuple[type, str, int, int], Persistent]" = OrderedDict()
+"""
+Objects loaded by :meth:`Persistent.from_dir`, keyed by class, absolute path, and the pickle file's modification time
+(in nanoseconds) and size.
+"""
+
+_from_dir_cache_lock = threading.Lock()
+"""Guards :data:`_from_dir_cache`, which may be used by many threads at once."""
+
 
 class Persistent:
     """
@@ -169,11 +307,34 @@ class Persistent:
         self.serializer.serialize(self, path, overwrite)
 
     @classmethod
-    def from_dir(cls, path: str, delete: bool = False) -> "Persistent":
+    def from_dir(cls, path: str, delete: bool = False, cache: bool = False) -> "Persistent":
         """
         Deserializes a full instance of this class from directory ``path``. If ``delete==True``,
-        the persisted instance will be deleted once loaded into memory.
+        the persisted instance will be deleted once loaded into memory. If ``cache==True`` (and ``delete==False``), the
+        loaded instance is cached, and returned again by later cached calls for the same unmodified ``path``, instead of
+        being deserialized again. Cached instances are shared between callers, so they should not be mutated.
         """
+        if not cache or delete:
+            return cls._load_from_dir(path, delete)
+
+        stat = os.stat(cls.serializer.get_pkl_path(path))
+        key = (cls, os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+        with _from_dir_cache_lock:
+            if key in _from_dir_cache:
+                _from_dir_cache.move_to_end(key)
+                return _from_dir_cache[key]
+        # Loading can be slow, so it's done without holding the lock. Concurrent misses for the same key may each load
+        # the object, and the last one loaded is kept.
+        obj = cls._load_from_dir(path, delete)
+        with _from_dir_cache_lock:
+            _from_dir_cache[key] = obj
+            if len(_from_dir_cache) > _FROM_DIR_CACHE_SIZE:
+                # Evict the least recently used object.
+                _from_dir_cache.popitem(last=False)
+        return obj
+
+    @classmethod
+    def _load_from_dir(cls, path: str, delete: bool) -> "Persistent":
         obj = cls.serializer.deserialize(path, delete)
         assert isinstance(obj, cls)
         return obj
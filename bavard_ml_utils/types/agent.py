@@ -1,6 +1,6 @@
+import json
 import typing as t
 from collections import defaultdict
-from itertools import chain
 
 from loguru import logger
 from pydantic import BaseModel
@@ -10,6 +10,14 @@ from bavard_ml_utils.types.conversations.conversation import Conversation, Conve
 from bavard_ml_utils.types.nlu import NLUExample, NLUExampleDataset
 
 
+try:
+    import orjson
+except ImportError:
+    _has_orjson = False
+else:
+    _has_orjson = True
+
+
 class Intent(BaseModel):
     name: str
 
@@ -59,39 +67,50 @@ class AgentConfig(BaseModel):
     given a conversation's state so far.
     """
 
+    class Config:
+        # Agent configs are often large and loaded from JSON, so `parse_raw` and `parse_file` use the faster `orjson`
+        # library when it's installed.
+        json_loads = orjson.loads if _has_orjson else json.loads
+
     def to_nlu_dataset(self, include_ood=False) -> NLUExampleDataset:
         """
         Converts the NLU examples in this config's :attr:`intentExamples`, :attr:`intentOODExamples`, and
         :attr:`trainingConversations` into an NLU dataset, for an NLU machine learning model to train on.
         """
-        copy = self.copy(deep=True)
+        copy = self._copy_for_cleaning()
         copy.clean()
         copy.incorporate_training_conversations()
-        return NLUExampleDataset(copy.all_nlu_examples(include_ood))
+        return NLUExampleDataset(copy.iter_nlu_examples(include_ood))
 
     def to_conversation_dataset(self, expand=True) -> ConversationDataset:
         """
         Converts this config's :attr:`trainingConversations` into a conversation dataset, for a dialogue poliy
         machine learning model to train on.
         """
-        copy = self.copy(deep=True)
+        copy = self._copy_for_cleaning()
         copy.clean()
         return ConversationDataset.from_conversations(copy.trainingConversations, expand)
 
     def all_nlu_examples(self, include_ood=False) -> t.List[NLUExample]:
-        examples = list(chain.from_iterable(self.intentExamples.values()))
+        return list(self.iter_nlu_examples(include_ood))
+
+    def iter_nlu_examples(self, include_ood=False) -> t.Iterator[NLUExample]:
+        """Like :meth:`all_nlu_examples`, but lazily yields the examples instead of collecting them into a list."""
+        for examples in self.intentExamples.values():
+            yield from examples
         if include_ood:
-            examples += [NLUExample(text=text, isOOD=True) for text in self.intentOODExamples]
-        return examples
+            for text in self.intentOODExamples:
+                # The text is already validated, so the example is built without validation.
+                yield NLUExample.construct(text=text, isOOD=True)
 
-    def intent_names(self) -> t.Set[str]:
-        return set(intent.name for intent in self.intents)
+    def intent_names(self) -> t.FrozenSet[str]:
+        return frozenset([intent.name for intent in self.intents])
 
-    def tag_names(self) -> t.Set[str]:
-        return set(self.tagTypes)
+    def tag_names(self) -> t.FrozenSet[str]:
+        return frozenset(self.tagTypes)
 
-    def action_names(self) -> t.Set[str]:
-        return set(a.name for a in self.actions)
+    def action_names(self) -> t.FrozenSet[str]:
+        return frozenset([a.name for a in self.actions])
 
     def clean(self):
         """Filters out invalid and unusable training data from the config."""
@@ -110,16 +129,17 @@ class AgentConfig(BaseModel):
         invalid_intents, invalid_tag_types = set(), set()
         lost_to_intents, lost_to_tags = 0, 0
 
-        for example in self.all_nlu_examples():
-            example_tag_types = set(tag.tagType for tag in example.tags or [])
+        for example in self.iter_nlu_examples():
             if example.intent not in valid_intents:
                 invalid_intents.add(example.intent)
                 lost_to_intents += 1
                 continue
-            if not example_tag_types.issubset(valid_tag_types):
-                invalid_tag_types.update(example_tag_types - valid_tag_types)
-                lost_to_tags += 1
-                continue
+            if example.tags:
+                example_tag_types = {tag.tagType for tag in example.tags}
+                if not example_tag_types.issubset(valid_tag_types):
+                    invalid_tag_types.update(example_tag_types - valid_tag_types)
+                    lost_to_tags += 1
+                    continue
             filtered[example.intent].append(example)
 
         self._warn_lost_data("NLU examples", lost_to_intents, "intents", invalid_intents)
@@ -128,11 +148,11 @@ class AgentConfig(BaseModel):
 
     def filter_no_agent_convs(self):
         """Removes all training conversations from this chatbot config which have no agent turns."""
-        self.trainingConversations = [c for c in self.trainingConversations if c.num_agent_turns > 0]
+        self.trainingConversations = [c for c in self.trainingConversations if c.has_agent_turn]
 
     def filter_invalid_intent_convs(self):
         """Removes all training conversations that use any intents not defined in the chatbot's :attr:`intents`."""
-        valid_intents = set(intent.name for intent in self.intents)
+        valid_intents = self.intent_names()
         invalid_intents = set()
         new_convs = []
         num_lost = 0
@@ -149,7 +169,7 @@ class AgentConfig(BaseModel):
         """
         Removes all training conversations that use any agent actions not defined in the chatbot's :attr:`actions`.
         """
-        valid_actions = set(a.name for a in self.actions)
+        valid_actions = self.action_names()
         invalid_actions = set()
         new_convs = []
         num_lost = 0
@@ -163,36 +183,55 @@ class AgentConfig(BaseModel):
         self.trainingConversations = new_convs
 
     def incorporate_training_conversations(self):
-        """Adds to this agent's NLU examples any valid examples present in its training conversations."""
+        """
+        Adds to this agent's NLU examples any valid examples present in its training conversations. The examples are
+        built without validation, since their values come from the already validated training conversations.
+        """
         valid_intents = self.intent_names()
+        user = Actor.USER  # bound locally, since it's checked for every turn of every conversation
         for conv in self.trainingConversations:
             for turn in conv.turns:
-                if turn.actor == Actor.USER:
+                if turn.actor is user:
                     if turn.userAction.intent in valid_intents and turn.userAction.utterance:
                         self.intentExamples[turn.userAction.intent].append(
-                            NLUExample(intent=turn.userAction.intent, text=turn.userAction.utterance, tags=[])
+                            NLUExample.construct(intent=turn.userAction.intent, text=turn.userAction.utterance, tags=[])
                         )
 
     @classmethod
     def from_conversation_dataset(cls, convs: ConversationDataset, name: str, **kwargs):
         """Builds an agent config from a conversation dataset, including all its conversations and NLU examples."""
         nlu_examples = convs.to_nlu_dataset()
+        intents, actions, tag_types, slots = convs.unique_values()
+        # Sort the NLU examples into in-domain examples by intent, and OOD example texts, in a single pass.
         examples_by_intent = defaultdict(list)
+        ood_texts = set()
         for ex in nlu_examples:
-            if not ex.isOOD and ex.intent is not None:
+            if ex.isOOD:
+                ood_texts.add(ex.text)
+            elif ex.intent is not None:
                 examples_by_intent[ex.intent].append(ex)
         return cls(
             name=name,
-            actions=[action.copy(deep=True) for action in convs.unique_actions().values()],
-            intents=[Intent(name=intent) for intent in convs.unique_intents()],
-            tagTypes=list(convs.unique_tag_types()),
-            slots=[Slot(name=slot) for slot in convs.unique_slots()],
-            intentOODExamples=list({ex.text for ex in nlu_examples if ex.isOOD}),
+            actions=[action.copy(deep=True) for action in actions.values()],
+            intents=[Intent(name=intent) for intent in intents],
+            tagTypes=list(tag_types),
+            slots=[Slot(name=slot) for slot in slots],
+            intentOODExamples=list(ood_texts),
             intentExamples=examples_by_intent,
             trainingConversations=list(convs),
             **kwargs,
         )
 
+    def _copy_for_cleaning(self) -> "AgentConfig":
+        """
+        Returns a shallow copy of this config, which can be cleaned and have its training conversations incorporated
+        without affecting ``self``. A deep copy isn't needed, since :meth:`clean` only ever replaces the copy's
+        :attr:`intentExamples` and :attr:`trainingConversations` with new containers, and
+        :meth:`incorporate_training_conversations` only appends to the containers created by :meth:`clean`. The
+        individual examples and conversations are shared with ``self``.
+        """
+        return self.copy()
+
     def _warn_lost_data(self, lost_type: str, num_lost: int, invalid_type: str, invalid: set):
         if num_lost > 0:
             logger.warning(
@@ -210,3 +249,6 @@ class AgentExport(BaseModel):
     """
 
     config: AgentConfig
+
+    class Config:
+        json_loads = AgentConfig.__config__.json_loads
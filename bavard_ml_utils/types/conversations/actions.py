@@ -11,13 +11,13 @@ class TagValue(BaseModel):
     value: str
 
 
-class Actor(Enum):
+class Actor(str, Enum):
     USER = "USER"
     AGENT = "AGENT"
     HUMAN_AGENT = "HUMAN_AGENT"
 
 
-class Sentiment(Enum):
+class Sentiment(str, Enum):
     NEGATIVE = "NEGATIVE"
     NEUTRAL = "NEUTRAL"
     POSITIVE = "POSITIVE"
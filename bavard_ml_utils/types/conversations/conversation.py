@@ -15,7 +15,12 @@ class Conversation(BaseModel):
 
     @property
     def num_agent_turns(self) -> int:
-        return sum(1 for turn in self.turns if turn.actor == Actor.AGENT)
+        return sum(1 for turn in self.turns if turn.actor is Actor.AGENT)
+
+    @property
+    def has_agent_turn(self) -> bool:
+        """``True`` if this conversation has at least one agent turn. Cheaper than checking :attr:`num_agent_turns`."""
+        return any(turn.actor is Actor.AGENT for turn in self.turns)
 
     @property
     def last_turn(self) -> t.Optional[DialogueTurn]:
@@ -26,7 +31,7 @@ class Conversation(BaseModel):
         intents = set(
             turn.userAction.intent
             for turn in self.turns
-            if turn.actor == Actor.USER and turn.userAction.intent is not None
+            if turn.actor is Actor.USER and turn.userAction.intent is not None
         )
         intents.discard("")
         intents.discard(None)
@@ -34,18 +39,23 @@ class Conversation(BaseModel):
 
     @property
     def actions_used(self):
-        actions = set(turn.agentAction.name for turn in self.turns if turn.actor == Actor.AGENT)
+        actions = set(turn.agentAction.name for turn in self.turns if turn.actor is Actor.AGENT)
         actions.discard("")
         return actions
 
     def expand(self) -> t.List["Conversation"]:
         """Turns this conversation into a list of its partial conversations that each end with an agent action."""
+        return [conv for conv, _ in self.expand_with_labels()]
+
+    def expand_with_labels(self) -> t.Iterator[t.Tuple["Conversation", str]]:
+        """
+        Like :meth:`expand`, but lazily yields each partial conversation along with the name of the agent action it
+        ends with. The partial conversations are built without validation, since their turns are already validated.
+        """
         cls = self.__class__
-        convs = []
-        for i in range(len(self)):
-            if self.turns[i].actor == Actor.AGENT:
-                convs.append(cls(turns=self.turns[: i + 1]))
-        return convs
+        for i, turn in enumerate(self.turns):
+            if turn.actor is Actor.AGENT:
+                yield cls.construct(turns=self.turns[: i + 1]), turn.agentAction.name
 
     def __len__(self):
         return len(self.turns)
@@ -80,13 +90,17 @@ class ConversationDataset(LabeledDataset[Conversation]):
         that each conversation end with an agent action. If ``expand==False``, expansion is bypassed, and the regular
         conversations are used.
         """
-        result = []
+        if not expand:
+            return cls(convs)
+        result, labels = [], []
         for conv in convs:
-            if expand:
-                result += conv.expand()
-            else:
-                result.append(conv)
-        return cls(result)
+            for expanded, label in conv.expand_with_labels():
+                result.append(expanded)
+                labels.append(label)
+        dataset = cls(result)
+        # The labels were found while expanding, so there's no need to look them up again later.
+        dataset._labels_cache = labels
+        return dataset
 
     def turns(self) -> t.Iterable[DialogueTurn]:
         """Iterates over all turns of all conversations in the dataset."""
@@ -105,44 +119,51 @@ class ConversationDataset(LabeledDataset[Conversation]):
                 yield turn
 
     def unique_intents(self) -> t.Set[str]:
-        intents = set()
-        for turn in self.user_turns():
-            if turn.userAction.intent is not None:
-                intents.add(turn.userAction.intent)
-        return intents
+        return self.unique_values()[0]
 
     def unique_actions(self) -> t.Dict[str, AgentAction]:
         """Returns a mapping of unique action names, each to an example of that action found in the dataset."""
-        actions = {}
-        for turn in self.agent_turns():
-            actions[turn.agentAction.name] = turn.agentAction
-        return actions
+        return self.unique_values()[1]
 
     def unique_tag_types(self) -> t.Set[str]:
-        tag_types = set()
-        for turn in self.user_turns():
-            if turn.userAction.tags is not None:
-                for tag in turn.userAction.tags:
-                    tag_types.add(tag.tagType)
-        return tag_types
+        return self.unique_values()[2]
 
     def unique_slots(self) -> t.Set[str]:
-        slots = set()
-        for turn in self.turns():
-            if turn.state is not None:
-                for slot_name in turn.state.slotValues:
-                    slots.add(slot_name)
-        return slots
+        return self.unique_values()[3]
+
+    def unique_values(self) -> t.Tuple[t.Set[str], t.Dict[str, AgentAction], t.Set[str], t.Set[str]]:
+        """
+        Returns the results of :meth:`unique_intents`, :meth:`unique_actions`, :meth:`unique_tag_types`, and
+        :meth:`unique_slots`, in that order, all found in a single pass over the dataset's turns.
+        """
+        intents, actions, tag_types, slots = set(), {}, set(), set()
+        add_tag_type = tag_types.add
+        for conv in self:
+            for turn in conv.turns:
+                if isinstance(turn, UserDialogueTurn):
+                    action = turn.userAction
+                    if action.intent is not None:
+                        intents.add(action.intent)
+                    if action.tags:
+                        for tag in action.tags:
+                            add_tag_type(tag.tagType)
+                elif isinstance(turn, AgentDialogueTurn):
+                    actions[turn.agentAction.name] = turn.agentAction
+                if turn.state is not None:
+                    # Adds all the slot names (the dict's keys) at once.
+                    slots.update(turn.state.slotValues)
+        return intents, actions, tag_types, slots
 
     def to_nlu_dataset(self):
+        # The examples' values come from already validated user actions, so they're built without validation.
         examples = []
         for turn in self.user_turns():
             action = turn.userAction
             if action.utterance is not None:
                 if action.ood:
-                    examples.append(NLUExample(text=action.utterance, isOOD=True))
+                    examples.append(NLUExample.construct(text=action.utterance, isOOD=True))
                 elif action.intent is not None:
-                    examples.append(NLUExample(text=action.utterance, intent=action.intent))
+                    examples.append(NLUExample.construct(text=action.utterance, intent=action.intent))
         return NLUExampleDataset(examples)
 
     def make_validation_pairs(self) -> t.Tuple["ConversationDataset", t.List[str]]:
@@ -158,9 +179,6 @@ class ConversationDataset(LabeledDataset[Conversation]):
             be taken, given the conversations; one action per conversation.
         """
         cls = self.__class__
-        val_convs = []
-        next_actions = []
-        for conv in self:
-            val_convs.append(Conversation(turns=conv.turns[:-1]))
-            next_actions.append(self.get_label(conv))
-        return cls(val_convs), next_actions
+        # The conversations' turns are already validated, so the truncated conversations are built without validation.
+        val_convs = [Conversation.construct(turns=conv.turns[:-1]) for conv in self]
+        return cls(val_convs), self.labels()
@@ -7,7 +7,10 @@ installed, which can be installed in this way:
    pip install bavard-ml-utils[ml]
 """
 import inspect
+import json
+import re
 import typing as t
+from functools import lru_cache
 from io import BytesIO
 
 from fastapi.encoders import jsonable_encoder
@@ -21,6 +24,20 @@ try:
 except ImportError:
     raise ImportExtraError("ml", __name__)
 
+try:
+    import orjson
+except ImportError:
+    _has_orjson = False
+else:
+    _has_orjson = True
+
+
+_NPY_V1_PREFIX = b"\x93NUMPY\x01\x00"
+"""The magic string and format version (1.0) that start data written by :func:`numpy.save` for simple dtypes."""
+
+_NPY_V1_HEADER = re.compile(r"\{'descr': '([^']+)', 'fortran_order': (True|False), 'shape': \(([0-9, ]*)\), \}")
+"""Matches the header :func:`numpy.save` writes for arrays whose dtype can be described by a type string."""
+
 
 def encode_numpy(data: np.ndarray, mode="w"):
     """
@@ -50,12 +67,65 @@ def decode_numpy(data: t.Union[str, bytes]):
     """
     if isinstance(data, str):
         data = data.encode("latin-1")
+    arr = _decode_simple_numpy(data)
+    if arr is not None:
+        return arr
     mf = BytesIO(data)
     arr = np.load(mf)
     mf.close()
     return arr
 
 
+def _decode_simple_numpy(data: bytes) -> t.Optional[np.ndarray]:
+    """
+    A fast path for :func:`decode_numpy`. :func:`numpy.load` parses the header with :func:`ast.literal_eval`, which
+    dominates the time it takes to load small arrays. The header of the common case (format version 1.0 and a dtype
+    described by a type string) is parsed here with a regex instead. Returns ``None`` for anything else, which should
+    be loaded with :func:`numpy.load`.
+    """
+    if not data.startswith(_NPY_V1_PREFIX):
+        return None
+    header_start = len(_NPY_V1_PREFIX) + 2
+    header_len = int.from_bytes(data[len(_NPY_V1_PREFIX) : header_start], "little")
+    match = _NPY_V1_HEADER.match(data[header_start : header_start + header_len].decode("latin-1"))
+    if match is None:
+        return None
+    descr, fortran_order, shape_str = match.groups()
+    dtype = np.dtype(descr)
+    if dtype.hasobject:
+        return None
+    shape = tuple(int(dim) for dim in shape_str.split(",") if dim.strip())
+    count = 1
+    for dim in shape:
+        count *= dim
+    flat = np.frombuffer(data, dtype=dtype, count=count, offset=header_start + header_len)
+    # Copy the data out of `data`, so the array is writeable and doesn't keep `data` alive, like `numpy.load`'s arrays.
+    if fortran_order == "True":
+        return flat.reshape(shape[::-1]).transpose().copy(order="K")
+    return flat.reshape(shape).copy()
+
+
+def _json_dumps(value: t.Any, *, default: t.Callable[[t.Any], t.Any], **kwargs) -> str:
+    """
+    Encodes ``value`` as JSON using the faster ``orjson`` library when it's installed. Its output is compact, and
+    doesn't escape non-ASCII characters. Falls back to :func:`json.dumps` when ``orjson`` isn't installed, when it
+    can't encode ``value`` (e.g. it contains a subclass of ``float`` other than a numpy scalar), or when any
+    :func:`json.dumps` options (e.g. ``sort_keys``) are given, so output produced with those options is unchanged.
+    """
+    if _has_orjson and not kwargs:
+        try:
+            return orjson.dumps(
+                value, default=default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            ).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(value, default=default, **kwargs)
+
+
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+"""Types whose values are already JSON compatible, and which :func:`jsonable_encoder` returns unchanged."""
+
+
 class DataModel(BaseModel):
     """
     A base class for defining pydantic models which automatically support numpy fields, including serialization and
@@ -77,6 +147,8 @@ class DataModel(BaseModel):
 
     class Config:
         arbitrary_types_allowed = True
+        json_loads = orjson.loads if _has_orjson else json.loads
+        json_dumps = _json_dumps
 
     def dict(self, custom_encoder: t.Optional[t.Dict[t.Any, t.Callable[[t.Any], t.Any]]] = None, **kwargs):
         """
@@ -92,13 +164,31 @@ class DataModel(BaseModel):
         d = super().dict(**kwargs)
         # TODO: the top level call to `DataModel.json()` bloats the string returned here by `encode_numpy`,
         #   because it inserts escape characters and converts '\x' to '\u00' sometimes.
-        return jsonable_encoder(d, custom_encoder=_custom_encoder, **kwargs)
+        # The `include` and `exclude` options were already applied by `super().dict`, and `jsonable_encoder` only
+        # forwards these options when encoding the values of a dict.
+        encoder_kwargs = {key: kwargs[key] for key in ("by_alias", "exclude_unset", "exclude_none") if key in kwargs}
+        encode_array = _custom_encoder[np.ndarray]
+        for key, value in d.items():
+            # `jsonable_encoder` walks every value recursively, which is slow, so skip it for the values that are
+            # already JSON compatible, and encode numpy arrays directly.
+            type_ = type(value)
+            if type_ in _JSON_SCALAR_TYPES:
+                continue
+            if type_ is np.ndarray:
+                d[key] = encode_array(value)
+            elif type_ is not list or not all(type(item) in _JSON_SCALAR_TYPES for item in value):
+                d[key] = jsonable_encoder(value, custom_encoder=_custom_encoder, **encoder_kwargs)
+        return d
 
     @classmethod
-    def _get_fields_of_type(cls, type_: t.Type) -> t.Set[str]:
-        """Get the name of the fields in this pydantic model that have an annotation of `type_`."""
+    @lru_cache(maxsize=None)
+    def _get_fields_of_type(cls, type_: t.Type) -> t.FrozenSet[str]:
+        """
+        Get the name of the fields in this pydantic model that have an annotation of `type_`. Cached per class, since
+        it's needed every time a model is constructed, and inspecting the model's signature is slow.
+        """
         sig = inspect.signature(cls)
-        return {param.name for param in sig.parameters.values() if param.annotation == type_}
+        return frozenset(param.name for param in sig.parameters.values() if param.annotation == type_)
 
     @root_validator(pre=True)
     def _validate_numpy_arrays(cls, values):
@@ -1,5 +1,10 @@
+import atexit
 import inspect
+import threading
+import time
 import typing as t
+from functools import lru_cache
+from queue import Full, Queue
 
 import requests
 from fastapi import HTTPException, Request, Response
@@ -21,12 +26,39 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 
 error_types = {"ERROR", "MINOR", "MAJOR", "CRITICAL"}
 
+_slack_session = requests.Session()
+"""
+Used by the background reporter thread for all the reports it sends, so connections to Slack are kept alive and
+reused. Sessions aren't thread safe, so reports sent from other threads use their own.
+"""
+
+_SLACK_TIMEOUT = 10.0
+"""Seconds to wait for Slack to respond to a report, so a hung request can't stall the reporter thread."""
+
+_EXIT_FLUSH_TIMEOUT = 10.0
+"""The most seconds the interpreter's exit is delayed to send reports that are still queued."""
+
+
+@lru_cache(maxsize=8)
+def _get_error_reporting_client(gcp_project_id: str) -> "error_reporting.Client":
+    """Creating a client is expensive (credential discovery, channel setup), so only do it once per project."""
+    return error_reporting.Client(gcp_project_id)
+
+
+_report_queue: "Queue[t.Tuple[str, t.Optional[str], t.Optional[str]]]" = Queue(maxsize=1024)
+"""Reports waiting to be sent by the background reporter thread."""
+
+_reporter_thread: t.Optional[threading.Thread] = None
+_reporter_lock = threading.Lock()
+
 
 def report_error(
     message: str,
     slack_url: t.Optional[str],
     gcp_project_id: t.Optional[str],
     severity: str = "ERROR",
+    *,
+    blocking: bool = False,
 ):
     """Reports an error ``message`` on Slack || Google Cloud || Both.
 
@@ -40,26 +72,88 @@ def report_error(
     gcp_project_id : str, optional
         If provided, this message will be sent to google cloud error reporting, associated with ``gcp_project_id``.
         Requires the ``gcp`` extra for this package to be installed.
+    blocking : bool, optional
+        By default, the report is queued and sent by a background thread, so the caller (e.g. a request handler) isn't
+        held up by network calls to Slack or GCP. If ``True``, the report is sent before this function returns.
     """
     assert severity in error_types
     error = f":boom: {severity}: {message}"
 
+    if gcp_project_id is not None and not _has_gcp_deps:
+        function_name = inspect.stack()[0][3]  # source: https://stackoverflow.com/a/5067654
+        raise ImportExtraError("gcp", function_name)
+
+    if slack_url is None and gcp_project_id is None:
+        return
+    if blocking:
+        with requests.Session() as session:
+            _send_report(error, slack_url, gcp_project_id, session)
+    else:
+        _enqueue_report(error, slack_url, gcp_project_id)
+
+
+def _send_report(
+    error: str, slack_url: t.Optional[str], gcp_project_id: t.Optional[str], session: requests.Session = _slack_session
+):
     if slack_url is not None:
         try:
-            requests.post(slack_url, json={"text": error})  # report on slack
+            session.post(slack_url, json={"text": error}, timeout=_SLACK_TIMEOUT)  # report on slack
         except Exception:
             logger.exception("encountered error while reporting error to Slack")
 
     if gcp_project_id is not None:
-        if not _has_gcp_deps:
-            function_name = inspect.stack()[0][3]  # source: https://stackoverflow.com/a/5067654
-            raise ImportExtraError("gcp", function_name)
         try:
-            error_reporting.Client(gcp_project_id).report(error)  # report on GCP
+            _get_error_reporting_client(gcp_project_id).report(error)  # report on GCP
         except Exception:
             logger.exception("encountered error while reporting error to GCP Error Reporting")
 
 
+def _enqueue_report(error: str, slack_url: t.Optional[str], gcp_project_id: t.Optional[str]):
+    _ensure_reporter_thread()
+    try:
+        _report_queue.put_nowait((error, slack_url, gcp_project_id))
+    except Full:
+        logger.error(f"error report queue is full; dropping report: {error}")
+
+
+def _ensure_reporter_thread():
+    global _reporter_thread
+    with _reporter_lock:
+        # The thread is started lazily, and restarted when needed, because threads don't survive a fork of the process
+        # (e.g. by a pre-forking web server).
+        if _reporter_thread is None or not _reporter_thread.is_alive():
+            _reporter_thread = threading.Thread(target=_process_report_queue, name="error-reporter", daemon=True)
+            _reporter_thread.start()
+
+
+def _process_report_queue():
+    while True:
+        report = _report_queue.get()
+        try:
+            _send_report(*report)
+        finally:
+            _report_queue.task_done()
+
+
+@atexit.register
+def _flush_report_queue(timeout: float = _EXIT_FLUSH_TIMEOUT):
+    """
+    Waits for the background thread to send any reports that are still queued, so they aren't lost when the
+    interpreter exits. Gives up after ``timeout`` seconds, so a hung call to Slack or GCP can't block the exit forever.
+    """
+    if not _report_queue.unfinished_tasks:
+        return
+    _ensure_reporter_thread()
+    deadline = time.monotonic() + timeout
+    with _report_queue.all_tasks_done:
+        while _report_queue.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.error(f"gave up sending {_report_queue.unfinished_tasks} error report(s) before exiting")
+                break
+            _report_queue.all_tasks_done.wait(remaining)
+
+
 def make_error_reporting_route_handler_class(
     *,
     msg_prefix: str = "",
@@ -1,7 +1,30 @@
 import typing as t
-from inspect import getmembers, ismethod
+from inspect import isfunction
 
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+
+try:
+    import orjson
+except ImportError:
+    _has_orjson = False
+else:
+    _has_orjson = True
+
+
+class _ORJSONResponse(ORJSONResponse):
+    """
+    Like :class:`ORJSONResponse`, but also accepts everything :class:`JSONResponse` does, e.g. dictionaries with
+    non-string keys and numpy scalars.
+    """
+
+    def render(self, content: t.Any) -> bytes:
+        try:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        except orjson.JSONEncodeError:
+            # e.g. subclasses of builtin types, which orjson rejects but `json` accepts.
+            return JSONResponse.render(self, content)
 
 
 def endpoint(_func=None, **fastapi_args) -> t.Callable:
@@ -62,6 +85,19 @@ class WebService:
     look like: ``{ "num": <int> }``.
     """
 
+    _endpoint_names: t.Tuple[str, ...] = ()
+    """The names of the methods decorated with :func:`endpoint`, found once when the class is defined."""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Walk the class hierarchy from the base down, so a method overridden without the decorator stops being an
+        # endpoint. Only class namespaces are scanned, so no properties or other descriptors are invoked.
+        is_endpoint: t.Dict[str, bool] = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                is_endpoint[name] = isfunction(value) and getattr(value, "is_endpoint", False) is True
+        cls._endpoint_names = tuple(name for name, flag in sorted(is_endpoint.items()) if flag)
+
     def _base_route(self) -> dict:
         """
         Landing page for the API.
@@ -78,8 +114,11 @@ class WebService:
         }
 
     def to_app(self) -> FastAPI:
-        """Converts the implementing class into an HTTP web service."""
-        app = FastAPI()
+        """
+        Converts the implementing class into an HTTP web service. Responses are encoded with the faster ``orjson``
+        library when it's installed.
+        """
+        app = FastAPI(default_response_class=_ORJSONResponse if _has_orjson else JSONResponse)
         for name, method in self._get_endpoints().items():
             app.add_api_route(
                 **{
@@ -99,8 +138,4 @@ class WebService:
         Identifies all the methods the implementing class has that have been
         decorated with the `endpoint` decorator.
         """
-        return {
-            name: member
-            for name, member in getmembers(self)
-            if ismethod(member) and hasattr(member, "is_endpoint") and member.is_endpoint is True
-        }
+        return {name: getattr(self, name) for name in self._endpoint_names}
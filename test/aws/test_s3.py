@@ -1,5 +1,12 @@
+import io
+import os
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
+from botocore.response import StreamingBody
+from botocore.stub import Stubber
+
+from bavard_ml_utils.aws import s3
 from bavard_ml_utils.aws.s3 import S3Client
 from test.utils import DirSpec, FileSpec
 
@@ -52,3 +59,53 @@ class TestS3Client(TestCase):
 
         # Clean up.
         downloaded_spec.remove()
+
+
+class TestS3ClientStubbed(TestCase):
+    """Tests the transfer paths against stubbed S3 responses, so they don't need an S3 emulator."""
+
+    def setUp(self):
+        self.s3 = S3Client()
+        self.stubber = Stubber(self.s3.client)
+        self.stubber.activate()
+        self.addCleanup(self.stubber.deactivate)
+
+    def test_connection_pool_fits_transfers(self):
+        self.assertGreaterEqual(self.s3.client.meta.config.max_pool_connections, s3._MAX_CONCURRENCY)
+
+    def test_upload_dir(self):
+        keys = []
+        self.s3.client.meta.events.register(
+            "before-parameter-build.s3.PutObject", lambda params, **kwargs: keys.append(params["Key"])
+        )
+        with TemporaryDirectory() as tmp:
+            paths = ["a.txt", "b.txt", os.path.join("sub", "c.txt")]
+            os.makedirs(os.path.join(tmp, "sub"))
+            for path in paths:
+                with open(os.path.join(tmp, path), "w") as f:
+                    f.write(path)
+            for _ in paths:
+                self.stubber.add_response("put_object", {})
+            self.s3.upload_dir(tmp, "bucket", "prefix", max_workers=4)
+        self.stubber.assert_no_pending_responses()
+        self.assertSetEqual(set(keys), {os.path.join("prefix", path) for path in paths})
+
+    def test_download_dir(self):
+        content = b"This is a test."
+        listing = Stubber(self.s3.resource.meta.client)
+        listing.add_response(
+            "list_objects",
+            {"Contents": [{"Key": "prefix/sub/c.txt"}], "IsTruncated": False},
+            {"Bucket": "bucket", "Prefix": "prefix"},
+        )
+        self.stubber.add_response(
+            "head_object", {"ContentLength": len(content)}, {"Bucket": "bucket", "Key": "prefix/sub/c.txt"}
+        )
+        self.stubber.add_response(
+            "get_object", {"Body": StreamingBody(io.BytesIO(content), len(content)), "ContentLength": len(content)}
+        )
+        with TemporaryDirectory() as tmp, listing:
+            self.s3.download_dir("bucket", "prefix", tmp, max_workers=4)
+            with open(os.path.join(tmp, "sub", "c.txt"), "rb") as f:
+                self.assertEqual(f.read(), content)
+        self.stubber.assert_no_pending_responses()
@@ -1,10 +1,11 @@
 import json
 from unittest import TestCase
 
+import numpy as np
 from google.auth.credentials import AnonymousCredentials
 from google.cloud.pubsub_v1 import SubscriberClient
 
-from bavard_ml_utils.gcp.pub_sub import PubSub
+from bavard_ml_utils.gcp.pub_sub import PubSub, _encode_json
 from test.config import PUBSUB_PROJECT_ID
 
 
@@ -30,6 +31,8 @@ class TestPubsubClient(TestCase):
 
         # Publish to the topic
         publisher.publish("test-topic", "Hello world!")
+        # Messages are sent in batches, so wait until it's actually been sent.
+        publisher.flush(timeout=10)
 
         # Pull the subscription
         response = subscriber.pull(request={"subscription": subscription, "max_messages": 1})
@@ -39,3 +42,18 @@ class TestPubsubClient(TestCase):
         message = response.received_messages[0].message.data.decode("utf-8")
         message = json.loads(message)
         self.assertEqual(message, "Hello world!")
+
+
+class TestEncodeJson(TestCase):
+    def test_encode_json(self):
+        class Score(float):
+            pass
+
+        for msg in [
+            "Hello world!",
+            {"a": [1, 2.5, None, True]},
+            {0: 0.2, 1: 0.8},
+            {"score": np.float64(0.5)},
+            {"score": Score(0.5)},
+        ]:
+            self.assertEqual(json.loads(_encode_json(msg)), json.loads(json.dumps(msg)))
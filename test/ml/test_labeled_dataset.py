@@ -43,3 +43,18 @@ class TestLabeledDataset(TestCase):
             self.assertSetEqual(set(test.labels()), self.labels)
             # The folds should contain all the samples.
             self.assertEqual(len(self.dataset), len(train) + len(test))
+
+    def test_labels_stay_in_sync_with_items(self):
+        # The cached labels should be recomputed whenever the dataset is mutated.
+        dataset = PairDataset(self.dataset)
+        self.assertEqual(dataset.labels(), [0, 0, 0, 1, 1, 2, 2])
+        dataset.append(("h", 3))
+        self.assertIn(3, dataset.unique_labels())
+        dataset[0] = ("a", 4)
+        self.assertEqual(dataset.get_label_distribution()[4], 1)
+        del dataset[-1]
+        self.assertNotIn(3, dataset.unique_labels())
+        dataset.extend([("i", 5), ("j", 5)])
+        self.assertEqual(dataset.get_label_distribution()[5], 2)
+        dataset.clear()
+        self.assertEqual(dataset.labels(), [])
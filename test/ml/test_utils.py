@@ -1,13 +1,29 @@
 from collections import defaultdict
-from unittest import TestCase
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
 
 import numpy as np
 import tensorflow as tf
 
-from bavard_ml_utils.ml.utils import make_stratified_folds, onehot
+from bavard_ml_utils.ml import utils
+from bavard_ml_utils.ml.utils import (
+    aggregate_dicts,
+    leave_one_out,
+    leave_one_out_lazy,
+    make_stratified_folds,
+    onehot,
+    to_object_array,
+)
 
 
 class TestUtils(TestCase):
+    def test_leave_one_out(self):
+        items = [1, 2, 3, 4]
+        expected = [(1, [2, 3, 4]), (2, [1, 3, 4]), (3, [1, 2, 4]), (4, [1, 2, 3])]
+        self.assertEqual(list(leave_one_out(items)), expected)
+        self.assertEqual([(item, list(rest)) for item, rest in leave_one_out_lazy(items)], expected)
+        self.assertEqual(items, [1, 2, 3, 4])  # the input should not have been modified
+
     def test_make_stratified_folds(self):
         data = list(range(10))
         labels = [0, 1] * 5
@@ -30,3 +46,44 @@ class TestUtils(TestCase):
         self.assertTrue(np.all(onehot(labels) == tf.one_hot(labels, depth).numpy()))
         labels = labels.reshape((2, 3))
         self.assertTrue(np.all(onehot(labels) == tf.one_hot(labels, depth).numpy()))
+
+    def test_onehot_label_range(self):
+        labels = np.array([[0, 2], [-1, -3]])
+        # Negative labels count back from the last class, like numpy indices do.
+        self.assertTrue(np.all(onehot(labels) == onehot(np.array([[0, 2], [2, 0]]))))
+        with self.assertRaises(IndexError):
+            onehot(np.array([0, 2, -4]))
+        with self.assertRaises(IndexError):
+            onehot(np.array([0.0, 1.0]))
+
+    @skipUnless(utils._has_numba, "numba is not installed")
+    def test_onehot_numba(self):
+        rng = np.random.default_rng(0)
+        size = utils._ONEHOT_NUMBA_MIN_SIZE + 1
+        for labels in [rng.integers(0, 7, size), rng.integers(-7, 7, (3, size)).astype(np.int32)]:
+            for axis in [0, -1]:
+                with patch.object(utils, "_has_numba", False):
+                    expected = onehot(labels, axis)
+                self.assertTrue(np.array_equal(onehot(labels, axis), expected))
+        with self.assertRaises(IndexError):
+            onehot(np.full(size, -8))
+
+    def test_to_object_array(self):
+        items = [(1, "a"), (2, "b"), (3, "c")]
+        arr = to_object_array(items)
+        # Sequence items stay whole, rather than becoming an extra dimension.
+        self.assertEqual(arr.shape, (3,))
+        self.assertEqual(arr[np.array([2, 0])].tolist(), [(3, "c"), (1, "a")])
+
+    def test_aggregate_dicts(self):
+        dicts = [
+            {"acc": 0.5, "n": 1, "per_class": {"a": 1.0, "b": 0.0}, "cm": np.array([[1, 0], [0, 1]])},
+            {"acc": 1.0, "n": 3, "per_class": {"a": 0.0, "b": 1.0}, "cm": np.array([[3, 2], [0, 1]])},
+        ]
+        mean = aggregate_dicts(dicts)
+        self.assertEqual(list(mean.keys()), ["acc", "n", "per_class", "cm"])
+        self.assertAlmostEqual(mean["acc"], 0.75)
+        self.assertAlmostEqual(mean["n"], 2)
+        self.assertDictEqual(mean["per_class"], {"a": 0.5, "b": 0.5})
+        self.assertTrue(np.all(mean["cm"] == np.array([[2, 1], [0, 1]])))
+        self.assertEqual(aggregate_dicts(dicts, "max")["n"], 3)
@@ -1,7 +1,9 @@
 import sys
+import threading
 import time
 import typing as t
 from unittest import TestCase
+from unittest.mock import patch
 
 import numpy as np
 
@@ -12,6 +14,7 @@ from bavard_ml_utils.persistence.artifact_manager import (
     ServiceVersionMetadata,
 )
 from bavard_ml_utils.persistence.record_store.firestore import FirestoreRecordStore
+from bavard_ml_utils.persistence.record_store.memory import InMemoryRecordStore
 from test.utils import clear_firestore
 
 
@@ -194,3 +197,66 @@ class TestArtifactManager(TestCase):
         for removed_version_name in set(version_names) - new_version_names:
             n_artifacts_for_version = sum(1 for _ in self.artifacts.get_all(service_version=removed_version_name))
             self.assertEqual(n_artifacts_for_version, 0)
+
+
+class TestRemoveOldVersionsInMemory(TestCase):
+    def setUp(self):
+        self.artifacts = InMemoryRecordStore[ArtifactRecord](ArtifactRecord)
+        self.datasets = InMemoryRecordStore[DatasetRecord](DatasetRecord)
+        self.versions = InMemoryRecordStore[ServiceVersionMetadata](ServiceVersionMetadata)
+        self.version_names = [f"v{i}" for i in range(8)]
+        dataset = DatasetRecord(examples=["a", "b"], agent_id="1", updated_at=time.time())
+        for i, version_name in enumerate(self.version_names):
+            self.versions.save(ServiceVersionMetadata(name=version_name, synced_at=i))
+            mgr = ArtifactManager(self.artifacts, self.datasets, self.versions, version_name)
+            mgr.save_artifact(mgr.create_artifact_from_dataset(dataset), dataset)
+        self.mgr = ArtifactManager(self.artifacts, self.datasets, self.versions, self.version_names[-1])
+
+    def test_removes_on_calling_thread_by_default(self):
+        threads = set()
+        delete_all = self.artifacts.delete_all
+
+        def record_thread(**where_equals):
+            threads.add(threading.current_thread())
+            return delete_all(**where_equals)
+
+        with patch.object(self.artifacts, "delete_all", side_effect=record_thread):
+            self.mgr._remove_old_service_versions()
+        # Record stores aren't necessarily thread safe, so the deletes only run concurrently when asked to.
+        self.assertEqual(threads, {threading.current_thread()})
+        self._assert_old_versions_removed()
+
+    def test_removes_concurrently(self):
+        self.mgr._remove_old_service_versions(max_workers=4)
+        self._assert_old_versions_removed()
+
+    def _assert_old_versions_removed(self):
+        self.assertSetEqual({v.name for v in self.versions.get_all()}, set(self.version_names[3:]))
+        self.assertSetEqual({a.service_version for a in self.artifacts.get_all()}, set(self.version_names[3:]))
+
+
+class TestDatasetRecordDigest(TestCase):
+    def setUp(self):
+        self.record = DatasetRecord(examples=["a", "b", "c"], agent_id="1", updated_at=time.time())
+
+    def test_stored_digest_is_reused(self):
+        stored = self.record.dict()
+        with patch.object(DatasetRecord, "compute_digest", wraps=self.record.compute_digest) as compute_digest:
+            loaded = DatasetRecord.parse_obj(stored)
+            compute_digest.assert_not_called()
+        self.assertEqual(loaded.digest, self.record.digest)
+        # The stored digest should be the one the record's data would hash to anyway.
+        self.assertEqual(loaded.compute_digest(), self.record.digest)
+
+    def test_missing_digest_is_computed(self):
+        stored = {**self.record.dict(), "digest": None}
+        self.assertEqual(DatasetRecord.parse_obj(stored).digest, self.record.digest)
+
+    def test_stale_digest(self):
+        stored = {**self.record.dict(), "examples": ["d", "e"]}
+        # A deserialized record's stored digest is trusted as is, even if its data has since changed...
+        self.assertEqual(DatasetRecord.parse_obj(stored).digest, self.record.digest)
+        # ...but a directly constructed record always gets a freshly computed one.
+        rebuilt = DatasetRecord(**stored)
+        self.assertNotEqual(rebuilt.digest, self.record.digest)
+        self.assertEqual(rebuilt.digest, rebuilt.compute_digest())
@@ -51,6 +51,7 @@ class TestRecordStore(TestCase):
         self.databases = [
             FirestoreRecordStore("fruits", Fruit),
             InMemoryRecordStore(Fruit),
+            InMemoryRecordStore(Fruit, indexed_fields=["color", "is_tropical"]),
             DynamoDBRecordStore("fruits", Fruit),
         ]
         self.apple = Fruit(name="apple", color="red", is_tropical=False, price=0.5)
@@ -453,3 +454,47 @@ class TestRecordStore(TestCase):
         db.save(Fruit(name="mango", color="yellow", is_tropical=True, price=3 * math.pi))
         db.save(Fruit(name="pear", color="green", is_tropical=False, price=0.75))
         db.save(Fruit(name="pear", color="green", is_tropical=False, price=1.5))
+
+
+class TestInMemoryRecordStoreIndexes(TestCase):
+    def setUp(self):
+        # Enough records that queries on the rare colors are selective enough to be resolved via the indexes.
+        self.db = InMemoryRecordStore(Fruit, indexed_fields=["color", "is_tropical"])
+        for i in range(200):
+            self.db.save(Fruit(name=f"green{i}", color="green", is_tropical=i % 2 == 0, price=i))
+        self.db.save(Fruit(name="red0", color="red", is_tropical=False, price=1.0))
+        self.db.save(Fruit(name="red1", color="red", is_tropical=True, price=2.0))
+
+    def _names(self, records) -> set:
+        return {record.name for record in records}
+
+    def test_indexed_queries(self):
+        self.assertSetEqual(self._names(self.db.get_all(color="red")), {"red0", "red1"})
+        self.assertSetEqual(self._names(self.db.get_all(color="red", is_tropical=True)), {"red1"})
+        self.assertSetEqual(self._names(self.db.get_all(color="red", price=1.0)), {"red0"})
+        self.assertEqual(len(list(self.db.get_all(color="blue"))), 0)
+
+    def test_mutate_then_save(self):
+        record = self.db.get("red0")
+        record.color = "yellow"
+        self.db.save(record)
+        self.assertSetEqual(self._names(self.db.get_all(color="red")), {"red1"})
+        self.assertSetEqual(self._names(self.db.get_all(color="yellow")), {"red0"})
+        self.assertEqual(self.db.delete_all(color="red"), 1)
+        self.assertIsNotNone(self.db.get("red0"))
+        self.assertIsNone(self.db.get("red1"))
+
+    def test_mutate_without_save(self):
+        # Records mutated in place should still only match the conditions they currently satisfy.
+        self.db.get("red0").color = "yellow"
+        self.assertSetEqual(self._names(self.db.get_all(color="red")), {"red1"})
+        self.assertEqual(self.db.delete_all(color="red"), 1)
+        self.assertIsNotNone(self.db.get("red0"))
+
+    def test_delete_all_indexed(self):
+        self.assertEqual(self.db.delete_all(color="red", is_tropical=False), 1)
+        self.assertIsNone(self.db.get("red0"))
+        self.assertSetEqual(self._names(self.db.get_all(color="red")), {"red1"})
+        self.assertEqual(self.db.delete_all(color="red"), 1)
+        self.assertEqual(len(list(self.db.get_all(color="red"))), 0)
+        self.assertEqual(len(list(self.db.get_all())), 200)
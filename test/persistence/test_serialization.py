@@ -1,16 +1,21 @@
 import inspect
 import os
+import pickle
 import shutil
+import threading
 import typing as t
 from tempfile import TemporaryDirectory
 from unittest import TestCase
+from unittest.mock import patch
 
+import numpy as np
 import tensorflow as tf
 from sklearn.datasets import load_iris
 from sklearn.linear_model import LogisticRegression
 from transformers import ReformerModelWithLMHead, ReformerTokenizer
 
-from bavard_ml_utils.persistence.serialization import Serializer, TypeSerializer
+from bavard_ml_utils.persistence import serialization
+from bavard_ml_utils.persistence.serialization import Persistent, Serializer, TypeSerializer
 
 
 class ReformerModelSerializer(TypeSerializer):
@@ -41,6 +46,40 @@ class KerasSerializer(TypeSerializer):
         return isinstance(obj, tf.keras.Model)
 
 
+class Note:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class NoteSerializer(TypeSerializer):
+    """Records which thread serialized each note."""
+
+    type_name = "note"
+    ext = "txt"
+
+    def __init__(self):
+        self.threads = []
+
+    def serialize(self, obj: Note, path: str):
+        if obj.text == "fail":
+            raise RuntimeError("can't serialize this note")
+        self.threads.append(threading.current_thread())
+        with open(path, "w") as f:
+            f.write(obj.text)
+
+    def deserialize(self, path: str) -> object:
+        with open(path) as f:
+            return Note(f.read())
+
+    def is_serializable(self, obj: object) -> bool:
+        return isinstance(obj, Note)
+
+
+class PersistentNotes(Persistent):
+    def __init__(self, *texts: str):
+        self.texts = list(texts)
+
+
 class TestClass:
     class_attr = "class_attr"
 
@@ -255,6 +294,124 @@ class TestSerialization(TestCase):
             loaded_model = serializer.deserialize(tmp)
         self.assertEqual(model, loaded_model)
 
+    def test_out_of_band_buffers(self):
+        data = {"weights": np.random.rand(1000, 768), "ids": np.arange(100_000), "name": "model"}
+        serializer = Serializer()
+        with TemporaryDirectory() as tmp:
+            serializer.serialize(data, tmp)
+            # The arrays' data is written to the buffers file, not copied into the pickle.
+            self.assertLess(os.path.getsize(os.path.join(tmp, "data.pkl")), 1000)
+            self.assertGreater(os.path.getsize(os.path.join(tmp, "data.buffers")), data["weights"].nbytes)
+            loaded = serializer.deserialize(tmp)
+        self.assertEqual(loaded.keys(), data.keys())
+        self.assertTrue(np.array_equal(loaded["weights"], data["weights"]))
+        self.assertTrue(np.array_equal(loaded["ids"], data["ids"]))
+        self.assertEqual(loaded["name"], "model")
+        # The loaded arrays are ordinary, writable arrays.
+        loaded["ids"][0] = -1
+
+    def test_can_load_legacy_dir(self):
+        # Directories serialized before out-of-band buffers were supported have no buffers file.
+        data = {"weights": np.random.rand(100, 10), "name": "model"}
+        with TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, "data.pkl"), "wb") as f:
+                pickle.dump(data, f, protocol=4)
+            loaded = Serializer().deserialize(tmp)
+        self.assertTrue(np.array_equal(loaded["weights"], data["weights"]))
+        self.assertEqual(loaded["name"], "model")
+
+    def test_overwrite_buffers(self):
+        serializer = Serializer()
+        with TemporaryDirectory() as tmp:
+            serializer.serialize({"weights": np.random.rand(100, 10)}, tmp)
+            self.assertTrue(os.path.isfile(os.path.join(tmp, "data.buffers")))
+            # Overwriting with data that has no buffers shouldn't leave the old buffers file behind.
+            serializer.serialize({"name": "model"}, tmp, overwrite=True)
+            self.assertFalse(os.path.isfile(os.path.join(tmp, "data.buffers")))
+            self.assertEqual(serializer.deserialize(tmp), {"name": "model"})
+            # So it can still be loaded by versions that predate out-of-band buffers.
+            with open(os.path.join(tmp, "data.pkl"), "rb") as f:
+                self.assertEqual(pickle.load(f), {"name": "model"})
+
+    def test_single_worker_serializes_inline(self):
+        note_serializer = NoteSerializer()
+        serializer = Serializer(note_serializer)
+        with TemporaryDirectory() as tmp:
+            with patch.object(serialization, "ThreadPoolExecutor") as executor:
+                serializer.serialize([Note("a"), Note("b")], tmp)
+            # No thread pool is started for a single worker.
+            executor.assert_not_called()
+            self.assertEqual(note_serializer.threads, [threading.current_thread()] * 2)
+            self.assertEqual([note.text for note in serializer.deserialize(tmp)], ["a", "b"])
+        with TemporaryDirectory() as tmp:
+            with self.assertRaises(RuntimeError):
+                serializer.serialize([Note("a"), Note("fail")], tmp)
+
+    def test_multiple_workers(self):
+        note_serializer = NoteSerializer()
+        serializer = Serializer(note_serializer, max_workers=4)
+        with TemporaryDirectory() as tmp:
+            serializer.serialize([Note(str(i)) for i in range(10)], tmp)
+            self.assertNotIn(threading.current_thread(), note_serializer.threads)
+            self.assertEqual([note.text for note in serializer.deserialize(tmp)], [str(i) for i in range(10)])
+        with TemporaryDirectory() as tmp:
+            # Errors from the type serializers' threads are raised to the caller.
+            with self.assertRaises(RuntimeError):
+                serializer.serialize([Note("a"), Note("fail")], tmp)
+
+    def test_deserialize_delete(self):
+        data = {"weights": np.random.rand(10, 10), "name": "model"}
+        serializer = Serializer()
+        with TemporaryDirectory() as parent:
+            path = os.path.join(parent, "data")
+            serializer.serialize(data, path)
+            loaded = serializer.deserialize(path, delete=True)
+            # The directory is gone once `deserialize` returns, and nothing is left beside it while it's deleted.
+            self.assertEqual(os.listdir(parent), [])
+
+            # If the directory can't be moved out of the way, it's deleted right away instead.
+            serializer.serialize(data, path)
+            with patch.object(serialization.os, "rename", side_effect=OSError):
+                serializer.deserialize(path, delete=True)
+            self.assertEqual(os.listdir(parent), [])
+        self.assertTrue(np.array_equal(loaded["weights"], data["weights"]))
+        self.assertEqual(loaded["name"], "model")
+
+    def test_from_dir_cache(self):
+        serialization._from_dir_cache.clear()
+        with TemporaryDirectory() as tmp:
+            PersistentNotes("a").to_dir(tmp)
+            loaded = PersistentNotes.from_dir(tmp, cache=True)
+            self.assertEqual(loaded.texts, ["a"])
+            # Cached calls for the unmodified directory return the same instance, without deserializing again.
+            with patch.object(PersistentNotes.serializer, "deserialize") as deserialize:
+                self.assertIs(PersistentNotes.from_dir(tmp, cache=True), loaded)
+            deserialize.assert_not_called()
+            # Uncached calls always deserialize.
+            self.assertIsNot(PersistentNotes.from_dir(tmp), loaded)
+
+            # Overwriting the directory invalidates its cached instance.
+            PersistentNotes("a", "b").to_dir(tmp, overwrite=True)
+            reloaded = PersistentNotes.from_dir(tmp, cache=True)
+            self.assertEqual(reloaded.texts, ["a", "b"])
+            self.assertIs(PersistentNotes.from_dir(tmp, cache=True), reloaded)
+
+    def test_from_dir_cache_eviction(self):
+        serialization._from_dir_cache.clear()
+        with TemporaryDirectory() as tmp:
+            paths = [os.path.join(tmp, str(i)) for i in range(serialization._FROM_DIR_CACHE_SIZE + 1)]
+            for path in paths:
+                PersistentNotes(path).to_dir(path)
+            first = PersistentNotes.from_dir(paths[0], cache=True)
+            second = PersistentNotes.from_dir(paths[1], cache=True)
+            # Using the first instance again makes the second the least recently used.
+            PersistentNotes.from_dir(paths[0], cache=True)
+            for path in paths[2:]:
+                PersistentNotes.from_dir(path, cache=True)
+            self.assertEqual(len(serialization._from_dir_cache), serialization._FROM_DIR_CACHE_SIZE)
+            self.assertIs(PersistentNotes.from_dir(paths[0], cache=True), first)
+            self.assertIsNot(PersistentNotes.from_dir(paths[1], cache=True), second)
+
     @staticmethod
     def _get_member_types(obj: object) -> dict:
         return {key: type(member) for key, member in inspect.getmembers(obj)}
@@ -38,3 +38,7 @@ class TestConversationDataset(TestCase):
         self.assertSetEqual(
             self.dataset.unique_labels(), {"Hotel-Inform", "Booking-Request", "Booking-NoBook", "general-reqmore"}
         )
+
+    def test_expanded_labels(self):
+        # The labels found while expanding should match the ones looked up from each conversation.
+        self.assertListEqual(self.dataset.labels(), [self.dataset.get_label(conv) for conv in self.dataset])
@@ -1,3 +1,5 @@
+import typing as t
+from io import BytesIO
 from unittest import TestCase
 
 import numpy as np
@@ -30,6 +32,13 @@ class TestModel(DataModel):
         return True
 
 
+class ScoredModel(DataModel):
+    score: float
+    count: int
+    name: str
+    scores: t.Dict[int, float]
+
+
 class TestData(TestCase):
     def setUp(self):
         self.array = np.random.normal(size=(3, 4))
@@ -42,6 +51,16 @@ class TestData(TestCase):
         # The model should have reconstructed perfectly.
         self.assertEqual(self.model, rebuilt)
 
+    def test_numpy_scalar_fields(self):
+        # Pydantic keeps numpy scalars passed to `float` and `int` fields as they are.
+        model = ScoredModel(score=np.float64(0.5), count=np.int64(3), name="\u00e9", scores={1: np.float32(0.25)})
+        self.assertIsInstance(model.score, np.float64)
+        rebuilt = ScoredModel.parse_raw(model.json())
+        self.assertEqual(rebuilt.score, 0.5)
+        self.assertEqual(rebuilt.count, 3)
+        self.assertEqual(rebuilt.name, "\u00e9")
+        self.assertEqual(rebuilt.scores, {1: 0.25})
+
     def test_can_convert_to_object(self):
         d = self.model.dict()
         rebuilt = TestModel.parse_obj(d)
@@ -54,3 +73,31 @@ class TestData(TestCase):
                 data = np.random.normal(size=(9, 11)).astype(dtype)
                 deserialized = decode_numpy(encode_numpy(data, mode))
                 self.assertTrue(np.array_equal(data, deserialized))
+
+    def test_numpy_serialization_edge_cases(self):
+        arrays = [
+            np.zeros((0, 3)),
+            np.array(5.0),
+            np.asfortranarray(np.arange(12).reshape(3, 4)),
+            np.arange(6, dtype=">i4").reshape(2, 3),
+            np.array(["ab", "cde"]),
+            np.zeros(3, dtype=[("a", "<i4"), ("b", "<f8")]),
+        ]
+        for data in arrays:
+            for mode in ["w", "wb"]:
+                deserialized = decode_numpy(encode_numpy(data, mode))
+                self.assertEqual(data.dtype, deserialized.dtype)
+                self.assertTrue(np.array_equal(data, deserialized))
+
+    def test_numpy_serialization_matches_np_save(self):
+        # The encoding must stay exactly `np.save`'s format, since it's part of hashed and persisted model data.
+        for data in [self.array, np.asfortranarray(self.array2), np.arange(5, dtype=">i2")]:
+            mf = BytesIO()
+            np.save(mf, data)
+            saved = mf.getvalue()
+            self.assertEqual(encode_numpy(data, "wb"), saved)
+            self.assertEqual(encode_numpy(data, "w"), saved.decode("latin-1"))
+            deserialized = decode_numpy(saved)
+            self.assertTrue(np.array_equal(data, deserialized))
+            self.assertEqual(data.flags.f_contiguous, deserialized.flags.f_contiguous)
+            self.assertTrue(deserialized.flags.writeable)
@@ -0,0 +1,61 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+import requests
+
+from bavard_ml_utils.web import errors
+from bavard_ml_utils.web.errors import report_error
+
+
+SLACK_URL = "https://hooks.slack.test/services/abc"
+
+
+class TestReportError(TestCase):
+    def setUp(self):
+        self.calls = []
+        self.release = threading.Event()
+        self.release.set()
+
+        def post(session, url, **kwargs):
+            self.release.wait()
+            self.calls.append((session, threading.current_thread(), url, kwargs))
+
+        patcher = patch.object(requests.Session, "post", autospec=True, side_effect=post)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.release.set()
+        errors._flush_report_queue()
+
+    def test_queued(self):
+        report_error("something broke", SLACK_URL, None)
+        errors._flush_report_queue()
+        self.assertEqual(len(self.calls), 1)
+        session, thread, url, kwargs = self.calls[0]
+        self.assertIs(session, errors._slack_session)
+        self.assertIs(thread, errors._reporter_thread)
+        self.assertEqual(url, SLACK_URL)
+        self.assertEqual(kwargs["json"], {"text": ":boom: ERROR: something broke"})
+        self.assertEqual(kwargs["timeout"], errors._SLACK_TIMEOUT)
+
+    def test_blocking(self):
+        report_error("something broke", SLACK_URL, None, blocking=True)
+        # The report is sent before returning, on the calling thread, with a session of its own.
+        self.assertEqual(len(self.calls), 1)
+        session, thread, url, kwargs = self.calls[0]
+        self.assertIsNot(session, errors._slack_session)
+        self.assertIs(thread, threading.current_thread())
+        self.assertEqual(url, SLACK_URL)
+        self.assertEqual(kwargs["json"], {"text": ":boom: ERROR: something broke"})
+        self.assertEqual(kwargs["timeout"], errors._SLACK_TIMEOUT)
+
+    def test_flush_is_bounded(self):
+        self.release.clear()  # Slack hangs
+        report_error("something broke", SLACK_URL, None)
+        start = time.monotonic()
+        errors._flush_report_queue(timeout=0.2)
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(self.calls, [])
@@ -2,6 +2,7 @@ import statistics
 import typing as t
 from unittest import TestCase
 
+import numpy as np
 from fastapi.testclient import TestClient
 from pydantic import BaseModel
 
@@ -58,6 +59,16 @@ class ClfWithFitEndpoint(WebService):
         return {"predictions": [self._mode] * len(X)}
 
 
+class ClfWithScores(WebService):
+    def fit(self, X, y):
+        self._classes = sorted(set(y))
+
+    @endpoint
+    def scores(self) -> dict:
+        # Non-string keys and numpy scalars are common in model outputs.
+        return {"scores": {c: 1 / len(self._classes) for c in self._classes}, "max": np.float64(0.2)}
+
+
 class TestWebService(TestCase):
     def setUp(self):
         self.X = [[0], [1], [2], [3], [4], [5], [6], [7], [8]]
@@ -126,6 +137,12 @@ class TestWebService(TestCase):
         self.assertEqual(res.status_code, 200)
         self.assertEqual(res.json()["predictions"], [2, 2, 2])
 
+    def test_json_responses(self):
+        client = self._get_client(ClfWithScores)
+        res = client.get("/scores")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json(), {"scores": {str(c): 0.2 for c in range(1, 6)}, "max": 0.2})
+
     def _get_client(self, cls: t.Type) -> TestClient:
         model = cls()
         model.fit(self.X, self.y)